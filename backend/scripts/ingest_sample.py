@@ -14,13 +14,16 @@ import time
 from src.core.config import get_settings
 from src.core.logging import setup_logging, get_logger
 from src.document_processing.chunker import FinancialDocumentChunker
-from src.document_processing.sec_downloader import SECEdgarDownloader
+from src.document_processing.sec_downloader import SECEdgarDownloader, process_filings
 from src.document_processing.sec_parser import SECFilingParser
 from src.rag.embeddings import EmbeddingService
 from src.rag.vector_store import create_vector_store
 
 logger = get_logger(__name__)
 
+# Filings processed concurrently
+INGEST_CONCURRENCY = 5
+
 
 async def ingest(ticker: str, filing_type: str, num_filings: int = 1) -> None:
     setup_logging()
@@ -31,8 +34,9 @@ async def ingest(ticker: str, filing_type: str, num_filings: int = 1) -> None:
 
     # Download
     downloader = SECEdgarDownloader()
-    filings = downloader.download_filing(ticker, filing_type, num_filings)
-    logger.info("filings_downloaded", count=len(filings))
+    filings = await asyncio.to_thread(
+        downloader.download_filing, ticker, filing_type, num_filings
+    )
 
     # Parse and chunk
     parser = SECFilingParser()
@@ -40,17 +44,25 @@ async def ingest(ticker: str, filing_type: str, num_filings: int = 1) -> None:
     embedding_service = EmbeddingService()
     vector_store = create_vector_store()
 
-    total_chunks = 0
-    for filing_data in filings:
-        parsed = parser.parse(filing_data["content"], filing_data)
-        chunks = chunker.chunk_filing(parsed)
+    async def process(filing_data: dict[str, str]) -> int:
+        parsed = await asyncio.to_thread(parser.parse, filing_data["content"], filing_data)
+        chunks = await asyncio.to_thread(chunker.chunk_filing, parsed)
 
         if chunks:
-            texts = [c.content for c in chunks]
-            embeddings = await embedding_service.embed_texts(texts)
+            embeddings = await embedding_service.embed_texts(
+                [c.content for c in chunks], [c.token_count for c in chunks]
+            )
             await vector_store.add_chunks(chunks, embeddings)
-            total_chunks += len(chunks)
             logger.info("filing_ingested", chunks=len(chunks))
+        return len(chunks)
+
+    results = await process_filings(filings, process, INGEST_CONCURRENCY)
+    total_chunks = 0
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("filing_ingest_failed", error=str(result))
+        else:
+            total_chunks += result
 
     elapsed = time.perf_counter() - start
     logger.info(
@@ -4,6 +4,12 @@ from __future__ import annotations
 
 from functools import lru_cache
 
+from src.api.ingest_jobs import IngestJobStore, get_ingest_job_store
+from src.document_processing.chunker import FinancialDocumentChunker
+from src.document_processing.sec_downloader import SECEdgarDownloader
+from src.document_processing.sec_parser import SECFilingParser
+from src.evaluation.evaluator import EvaluationPipeline
+from src.llm.client import LLMClient
 from src.orchestration.workflow import QueryOrchestrator
 
 
@@ -15,3 +21,52 @@ def _get_orchestrator_singleton() -> QueryOrchestrator:
 def get_orchestrator() -> QueryOrchestrator:
     """Dependency provider for the query orchestrator singleton."""
     return _get_orchestrator_singleton()
+
+
+def get_llm_client() -> LLMClient:
+    """Dependency provider for the LLM client shared with the orchestrator."""
+    return _get_orchestrator_singleton().llm_client
+
+
+def get_evaluation_pipeline() -> EvaluationPipeline:
+    """Dependency provider for the orchestrator's evaluation pipeline."""
+    return _get_orchestrator_singleton().evaluation
+
+
+# Document-processing components hold no per-request state, so one instance
+# of each serves every request
+
+
+@lru_cache(maxsize=1)
+def _get_parser_singleton() -> SECFilingParser:
+    return SECFilingParser()
+
+
+@lru_cache(maxsize=1)
+def _get_chunker_singleton() -> FinancialDocumentChunker:
+    return FinancialDocumentChunker()
+
+
+@lru_cache(maxsize=1)
+def _get_downloader_singleton() -> SECEdgarDownloader:
+    return SECEdgarDownloader()
+
+
+def get_parser() -> SECFilingParser:
+    """Dependency provider for the SEC filing parser singleton."""
+    return _get_parser_singleton()
+
+
+def get_chunker() -> FinancialDocumentChunker:
+    """Dependency provider for the document chunker singleton."""
+    return _get_chunker_singleton()
+
+
+def get_downloader() -> SECEdgarDownloader:
+    """Dependency provider for the SEC EDGAR downloader singleton."""
+    return _get_downloader_singleton()
+
+
+def get_job_store() -> IngestJobStore:
+    """Dependency provider for the background ingestion job store."""
+    return get_ingest_job_store()
@@ -0,0 +1,76 @@
+"""Pure-ASGI interceptor for Kubernetes readiness and liveness probes.
+
+Probes are answered before the request reaches FastAPI, so they skip
+middleware, route matching, and response-model serialization entirely.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# Pre-serialized probe bodies keyed by path
+PROBE_RESPONSES: dict[str, bytes] = {
+    "/ready": b'{"status":"ready"}',
+    "/live": b'{"status":"alive"}',
+}
+
+_JSON_HEADERS: dict[str, list[tuple[bytes, bytes]]] = {
+    path: [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    for path, body in PROBE_RESPONSES.items()
+}
+
+_METHOD_NOT_ALLOWED_BODY = b'{"detail":"Method Not Allowed"}'
+_METHOD_NOT_ALLOWED_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_METHOD_NOT_ALLOWED_BODY)).encode()),
+    (b"allow", b"GET, HEAD"),
+]
+
+
+class HealthCheckInterceptor:
+    """Wraps an ASGI app and short-circuits probe requests.
+
+    Any request whose path is not a probe endpoint (including lifespan
+    and websocket scopes) is forwarded to the wrapped application.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in PROBE_RESPONSES:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method in ("GET", "HEAD"):
+            path = scope["path"]
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": _JSON_HEADERS[path],
+            })
+            await send({
+                "type": "http.response.body",
+                "body": PROBE_RESPONSES[path] if method == "GET" else b"",
+            })
+            return
+
+        await send({
+            "type": "http.response.start",
+            "status": 405,
+            "headers": _METHOD_NOT_ALLOWED_HEADERS,
+        })
+        await send({
+            "type": "http.response.body",
+            "body": _METHOD_NOT_ALLOWED_BODY,
+        })
@@ -0,0 +1,49 @@
+"""Redis-backed status records for background SEC ingestion jobs.
+
+Job state lives in Redis rather than process memory so any API replica
+can answer a status poll, whichever one accepted the job.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from src.core.config import get_settings
+from src.models.schemas import IngestJob
+
+# Finished jobs stay queryable for a day
+JOB_TTL_SECONDS = 24 * 3600
+
+_KEY_PREFIX = "ingest_job:"
+
+
+class IngestJobStore:
+    """Saves and loads ingestion job records as JSON strings."""
+
+    def __init__(self, redis: Redis) -> None:
+        self._redis = redis
+
+    async def save(self, job: IngestJob) -> None:
+        await self._redis.set(_KEY_PREFIX + job.job_id, job.model_dump_json(), ex=JOB_TTL_SECONDS)
+
+    async def get(self, job_id: str) -> IngestJob | None:
+        raw = await self._redis.get(_KEY_PREFIX + job_id)
+        return IngestJob.model_validate_json(raw) if raw is not None else None
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+@lru_cache(maxsize=1)
+def get_ingest_job_store() -> IngestJobStore:
+    """Process-wide job store; the Redis connection is opened on first use."""
+    return IngestJobStore(Redis.from_url(get_settings().redis_url))
+
+
+async def close_ingest_job_store() -> None:
+    """Close the job store's Redis connection pool if one was created."""
+    if get_ingest_job_store.cache_info().currsize:
+        await get_ingest_job_store().close()
+        get_ingest_job_store.cache_clear()
@@ -2,19 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import os
 import time
-
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-
-from src.api.dependencies import get_orchestrator
+from datetime import UTC, datetime
+from typing import BinaryIO
+from uuid import uuid4
+
+import pypdfium2 as pdfium
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File
+
+from src.api.dependencies import (
+    get_chunker,
+    get_downloader,
+    get_job_store,
+    get_orchestrator,
+    get_parser,
+)
+from src.api.ingest_jobs import IngestJobStore
+from src.core.config import get_settings
 from src.core.exceptions import DocumentProcessingError
-from src.document_processing.chunker import FinancialDocumentChunker
-from src.document_processing.sec_downloader import SECEdgarDownloader
+from src.core.logging import get_logger
+from src.document_processing.chunker import FinancialDocumentChunker, get_process_pool
+from src.document_processing.sec_downloader import SECEdgarDownloader, process_filings
 from src.document_processing.sec_parser import SECFilingParser
 from src.models.schemas import (
+    DocumentChunk,
     DocumentMetadata,
     DocumentUploadRequest,
     DocumentUploadResponse,
+    FilingType,
+    IngestJob,
+    IngestJobStatus,
     SECFilingRequest,
     SECFilingResponse,
 )
@@ -22,16 +42,33 @@ from src.monitoring.metrics import (
     CHUNKS_CREATED,
     DOCUMENTS_PROCESSED,
     DOCUMENT_PROCESSING_LATENCY,
+    labeled,
 )
 from src.orchestration.workflow import QueryOrchestrator
 
+logger = get_logger(__name__)
+
 router = APIRouter(prefix="/api/v1/documents", tags=["Documents"])
 
+# Filings parsed, embedded, and stored at once during SEC ingestion
+INGEST_CONCURRENCY = 5
+
+# Uploads are read and decoded in pieces of this size
+UPLOAD_READ_CHUNK_BYTES = 1024 * 1024
+
+# File types accepted by the upload endpoint
+_ALLOWED_EXT = frozenset({".txt", ".html", ".htm", ".pdf"})
+
+# Leading bytes inspected to reject misnamed binaries before any parsing
+UPLOAD_SNIFF_BYTES = 512
+
 
 @router.post("/ingest", response_model=DocumentUploadResponse)
 async def ingest_document(
     request: DocumentUploadRequest,
     orchestrator: QueryOrchestrator = Depends(get_orchestrator),
+    parser: SECFilingParser = Depends(get_parser),
+    chunker: FinancialDocumentChunker = Depends(get_chunker),
 ) -> DocumentUploadResponse:
     """Ingest a financial document (raw text or URL).
 
@@ -52,9 +89,9 @@ async def ingest_document(
     try:
         content = request.content or ""
 
-        # Parse
-        parser = SECFilingParser()
-        filing = parser.parse(
+        # Parse and chunk off the event loop; both are CPU-bound
+        filing = await asyncio.to_thread(
+            parser.parse,
             raw_content=content,
             filing_metadata={
                 "company_name": request.company_ticker,
@@ -63,29 +100,27 @@ async def ingest_document(
                 "filing_date": "",
             },
         )
-
-        # Chunk
-        chunker = FinancialDocumentChunker()
-        chunks = chunker.chunk_filing(filing)
+        chunks = await asyncio.to_thread(chunker.chunk_filing, filing)
 
         # Embed and store
-        chunk_texts = [c.content for c in chunks]
-        embeddings = await orchestrator.embedding_service.embed_texts(chunk_texts)
+        embeddings = await orchestrator.embedding_service.embed_texts(
+            [c.content for c in chunks], [c.token_count for c in chunks]
+        )
         stored = await orchestrator.vector_store.add_chunks(chunks, embeddings)
 
-        elapsed_ms = (time.perf_counter() - start) * 1000
+        elapsed_s = time.perf_counter() - start
 
         # Track metrics
-        DOCUMENTS_PROCESSED.labels(filing_type=request.filing_type.value).inc()
+        labeled(DOCUMENTS_PROCESSED, filing_type=request.filing_type.value).inc()
         CHUNKS_CREATED.inc(len(chunks))
-        DOCUMENT_PROCESSING_LATENCY.observe(elapsed_ms / 1000)
+        DOCUMENT_PROCESSING_LATENCY.observe(elapsed_s)
 
         return DocumentUploadResponse(
             document_id=chunks[0].document_id if chunks else "",
             chunks_created=stored,
             company=request.company_ticker,
             filing_type=request.filing_type,
-            processing_time_ms=round(elapsed_ms, 2),
+            processing_time_ms=round(elapsed_s * 1000, 2),
         )
 
     except DocumentProcessingError as e:
@@ -98,6 +133,9 @@ async def ingest_document(
 async def ingest_sec_filing(
     request: SECFilingRequest,
     orchestrator: QueryOrchestrator = Depends(get_orchestrator),
+    downloader: SECEdgarDownloader = Depends(get_downloader),
+    parser: SECFilingParser = Depends(get_parser),
+    chunker: FinancialDocumentChunker = Depends(get_chunker),
 ) -> SECFilingResponse:
     """Download and ingest SEC filings directly from EDGAR.
 
@@ -105,62 +143,151 @@ async def ingest_sec_filing(
     SEC EDGAR, parses it into sections, chunks it, and indexes
     it in the vector store.
     """
-    start = time.perf_counter()
+    try:
+        return await _ingest_sec(request, orchestrator, downloader, parser, chunker)
+    except DocumentProcessingError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
 
+@router.post("/ingest/sec/jobs", response_model=IngestJob, status_code=202)
+async def submit_sec_ingest_job(
+    request: SECFilingRequest,
+    background: BackgroundTasks,
+    orchestrator: QueryOrchestrator = Depends(get_orchestrator),
+    downloader: SECEdgarDownloader = Depends(get_downloader),
+    parser: SECFilingParser = Depends(get_parser),
+    chunker: FinancialDocumentChunker = Depends(get_chunker),
+    jobs: IngestJobStore = Depends(get_job_store),
+) -> IngestJob:
+    """Queue an SEC EDGAR ingestion and return immediately.
+
+    The ingestion runs after the response is sent; poll
+    ``GET /ingest/sec/jobs/{job_id}`` for its status and result.
+    """
+    job = IngestJob(job_id=uuid4().hex, ticker=request.ticker, filing_type=request.filing_type)
+    await jobs.save(job)
+    background.add_task(
+        _run_ingest_job, job, request, orchestrator, downloader, parser, chunker, jobs
+    )
+    return job
+
+
+@router.get("/ingest/sec/jobs/{job_id}", response_model=IngestJob)
+async def get_sec_ingest_job(
+    job_id: str,
+    jobs: IngestJobStore = Depends(get_job_store),
+) -> IngestJob:
+    """Return the status of a queued SEC ingestion, with its result once done."""
+    job = await jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown ingestion job: {job_id}")
+    return job
+
+
+async def _run_ingest_job(
+    job: IngestJob,
+    request: SECFilingRequest,
+    orchestrator: QueryOrchestrator,
+    downloader: SECEdgarDownloader,
+    parser: SECFilingParser,
+    chunker: FinancialDocumentChunker,
+    jobs: IngestJobStore,
+) -> None:
+    job.status = IngestJobStatus.RUNNING
+    job.started_at = datetime.now(UTC)
+    await jobs.save(job)
     try:
-        # Download from SEC EDGAR
-        downloader = SECEdgarDownloader()
-        filings = downloader.download_filing(
-            ticker=request.ticker,
-            filing_type=request.filing_type.value,
-            num_filings=request.num_filings,
-        )
+        job.result = await _ingest_sec(request, orchestrator, downloader, parser, chunker)
+        job.status = IngestJobStatus.COMPLETED
+    except Exception as e:
+        logger.error("sec_ingest_job_failed", job_id=job.job_id, error=str(e))
+        job.status = IngestJobStatus.FAILED
+        job.error = str(e)
+    await jobs.save(job)
 
-        parser = SECFilingParser()
-        chunker = FinancialDocumentChunker()
-        total_chunks = 0
 
-        for filing_data in filings:
-            # Parse
-            parsed = parser.parse(
+async def _ingest_sec(
+    request: SECFilingRequest,
+    orchestrator: QueryOrchestrator,
+    downloader: SECEdgarDownloader,
+    parser: SECFilingParser,
+    chunker: FinancialDocumentChunker,
+) -> SECFilingResponse:
+    start = time.perf_counter()
+
+    # Download from SEC EDGAR; the client is synchronous
+    filings = await asyncio.to_thread(
+        downloader.download_filing,
+        ticker=request.ticker,
+        filing_type=request.filing_type.value,
+        num_filings=request.num_filings,
+    )
+
+    loop = asyncio.get_running_loop()
+
+    async def parse_and_chunk(filing_data: dict[str, str]) -> list[DocumentChunk]:
+        # Parsing and chunking are CPU-bound; run them off the event
+        # loop. Bulk loads parse in worker processes so the regex-heavy
+        # HTML parsing of several filings runs in parallel.
+        if request.bulk:
+            parsed = await loop.run_in_executor(
+                get_process_pool(), parser.parse, filing_data["content"], filing_data
+            )
+        else:
+            parsed = await asyncio.to_thread(
+                parser.parse,
                 raw_content=filing_data["content"],
                 filing_metadata=filing_data,
             )
+        return await asyncio.to_thread(chunker.chunk_filing, parsed)
+
+    # One failed filing does not abort the rest of the batch
+    results = await process_filings(filings, parse_and_chunk, INGEST_CONCURRENCY)
+    failures = [r for r in results if isinstance(r, Exception)]
+    for error in failures:
+        logger.warning("sec_filing_ingest_failed", ticker=request.ticker, error=str(error))
+    if failures and len(failures) == len(results):
+        raise failures[0]
+
+    # Embed every filing's chunks together so the provider batches are
+    # filled across filings instead of one underfilled call per filing
+    all_chunks = [c for r in results if not isinstance(r, Exception) for c in r]
+    if all_chunks:
+        embeddings = await orchestrator.embedding_service.embed_texts(
+            [c.content for c in all_chunks], [c.token_count for c in all_chunks]
+        )
+        vector_store = orchestrator.vector_store
+        store = vector_store.bulk_add_chunks if request.bulk else vector_store.add_chunks
+        await store(all_chunks, embeddings)
 
-            # Chunk
-            chunks = chunker.chunk_filing(parsed)
-
-            # Embed and store
-            if chunks:
-                texts = [c.content for c in chunks]
-                embeddings = await orchestrator.embedding_service.embed_texts(texts)
-                await orchestrator.vector_store.add_chunks(chunks, embeddings)
-                total_chunks += len(chunks)
-
-        elapsed_ms = (time.perf_counter() - start) * 1000
+    documents_processed = len(results) - len(failures)
+    total_chunks = len(all_chunks)
 
-        DOCUMENTS_PROCESSED.labels(filing_type=request.filing_type.value).inc(len(filings))
-        CHUNKS_CREATED.inc(total_chunks)
-        DOCUMENT_PROCESSING_LATENCY.observe(elapsed_ms / 1000)
+    elapsed_s = time.perf_counter() - start
 
-        return SECFilingResponse(
-            ticker=request.ticker,
-            filing_type=request.filing_type,
-            documents_processed=len(filings),
-            total_chunks=total_chunks,
-            processing_time_ms=round(elapsed_ms, 2),
-        )
+    labeled(DOCUMENTS_PROCESSED, filing_type=request.filing_type.value).inc(
+        documents_processed
+    )
+    CHUNKS_CREATED.inc(total_chunks)
+    DOCUMENT_PROCESSING_LATENCY.observe(elapsed_s)
 
-    except DocumentProcessingError as e:
-        raise HTTPException(status_code=422, detail=str(e)) from e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    return SECFilingResponse(
+        ticker=request.ticker,
+        filing_type=request.filing_type,
+        documents_processed=documents_processed,
+        total_chunks=total_chunks,
+        processing_time_ms=round(elapsed_s * 1000, 2),
+    )
 
 
 @router.post("/upload")
 async def upload_document(
     file: UploadFile = File(...),
     orchestrator: QueryOrchestrator = Depends(get_orchestrator),
+    parser: SECFilingParser = Depends(get_parser),
+    chunker: FinancialDocumentChunker = Depends(get_chunker),
 ) -> DocumentUploadResponse:
     """Upload a financial document file (PDF, TXT, HTML)."""
     start = time.perf_counter()
@@ -168,20 +295,32 @@ async def upload_document(
     if not file.filename:
         raise HTTPException(status_code=400, detail="No filename provided")
 
-    allowed_extensions = {".txt", ".html", ".htm", ".pdf"}
-    ext = "." + file.filename.rsplit(".", 1)[-1].lower() if "." in file.filename else ""
-    if ext not in allowed_extensions:
+    ext = os.path.splitext(file.filename)[1].lower()
+    if ext not in _ALLOWED_EXT:
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported file type: {ext}. Allowed: {allowed_extensions}",
+            detail=f"Unsupported file type: {ext}. Allowed: {sorted(_ALLOWED_EXT)}",
         )
 
-    try:
-        content = await file.read()
-        text_content = content.decode("utf-8", errors="replace")
+    max_bytes = get_settings().max_upload_size_mb * 1024 * 1024
+    if file.size is not None and file.size > max_bytes:
+        raise _upload_too_large(max_bytes)
 
-        parser = SECFilingParser()
-        filing = parser.parse(
+    head = await file.read(UPLOAD_SNIFF_BYTES)
+    if not _content_matches(ext, head):
+        raise HTTPException(
+            status_code=415,
+            detail=f"File content does not match its {ext} extension",
+        )
+    await file.seek(0)
+    if ext == ".pdf":
+        text_content = await _read_pdf_text(file, max_bytes)
+    else:
+        text_content = await _read_text(file, max_bytes)
+
+    try:
+        filing = await asyncio.to_thread(
+            parser.parse,
             raw_content=text_content,
             filing_metadata={
                 "company_name": file.filename,
@@ -190,25 +329,85 @@ async def upload_document(
                 "filing_date": "",
             },
         )
-
-        chunker = FinancialDocumentChunker()
-        chunks = chunker.chunk_filing(filing)
+        chunks = await asyncio.to_thread(chunker.chunk_filing, filing)
 
         if chunks:
-            texts = [c.content for c in chunks]
-            embeddings = await orchestrator.embedding_service.embed_texts(texts)
+            embeddings = await orchestrator.embedding_service.embed_texts(
+                [c.content for c in chunks], [c.token_count for c in chunks]
+            )
             await orchestrator.vector_store.add_chunks(chunks, embeddings)
 
-        elapsed_ms = (time.perf_counter() - start) * 1000
+        elapsed_s = time.perf_counter() - start
 
-        from src.models.schemas import FilingType
         return DocumentUploadResponse(
             document_id=chunks[0].document_id if chunks else "",
             chunks_created=len(chunks),
             company=file.filename,
             filing_type=FilingType.OTHER,
-            processing_time_ms=round(elapsed_ms, 2),
+            processing_time_ms=round(elapsed_s * 1000, 2),
         )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+async def _read_text(file: UploadFile, max_bytes: int) -> str:
+    """Decode an upload incrementally so its raw bytes are never held in full."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parts: list[str] = []
+    size = 0
+    while chunk := await file.read(UPLOAD_READ_CHUNK_BYTES):
+        size += len(chunk)
+        if size > max_bytes:
+            raise _upload_too_large(max_bytes)
+        parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
+async def _read_pdf_text(file: UploadFile, max_bytes: int) -> str:
+    """Extract a PDF upload's text once its size is known to be within the cap.
+
+    pdfium needs random access to the whole file, so unlike text uploads the
+    size is checked on the spooled file before any parsing starts.
+    """
+    size = await asyncio.to_thread(_stream_size, file.file)
+    if size > max_bytes:
+        raise _upload_too_large(max_bytes)
+    return await asyncio.to_thread(_extract_pdf_text, file.file)
+
+
+def _stream_size(stream: BinaryIO) -> int:
+    size = stream.seek(0, os.SEEK_END)
+    stream.seek(0)
+    return size
+
+
+def _content_matches(ext: str, head: bytes) -> bool:
+    """Check an upload's leading bytes against its claimed file type."""
+    if ext == ".pdf":
+        return head.startswith(b"%PDF")
+    if b"\x00" in head:
+        return False
+    if ext == ".txt":
+        return True
+    return head.lstrip(codecs.BOM_UTF8 + b" \t\r\n").startswith(b"<")
+
+
+def _extract_pdf_text(stream: BinaryIO) -> str:
+    """Pull the text layer out of a PDF page by page."""
+    try:
+        pdf = pdfium.PdfDocument(stream)
+        try:
+            return "\n".join(page.get_textpage().get_text_range() for page in pdf)
+        finally:
+            pdf.close()
+    except pdfium.PdfiumError as e:
+        raise HTTPException(status_code=422, detail=f"Unreadable PDF: {e}") from e
+
+
+def _upload_too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"File exceeds the {max_bytes // (1024 * 1024)} MB upload limit",
+    )
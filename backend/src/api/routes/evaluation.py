@@ -10,13 +10,13 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from src.api.dependencies import get_orchestrator
+from src.api.dependencies import get_evaluation_pipeline
+from src.evaluation.evaluator import EvaluationPipeline
 from src.models.schemas import (
     EvaluationRequest,
     EvaluationResult,
     EvaluationMetrics,
 )
-from src.orchestration.workflow import QueryOrchestrator
 
 router = APIRouter(prefix="/api/v1/evaluation", tags=["Evaluation"])
 
@@ -24,7 +24,7 @@ router = APIRouter(prefix="/api/v1/evaluation", tags=["Evaluation"])
 @router.post("/evaluate", response_model=EvaluationResult)
 async def evaluate_response(
     request: EvaluationRequest,
-    orchestrator: QueryOrchestrator = Depends(get_orchestrator),
+    pipeline: EvaluationPipeline = Depends(get_evaluation_pipeline),
 ) -> EvaluationResult:
     """Evaluate an LLM response against source documents.
 
@@ -37,15 +37,6 @@ async def evaluate_response(
     to re-evaluate previously generated responses.
     """
     try:
-        from src.evaluation.evaluator import EvaluationPipeline
-        from src.llm.client import LLMClient
-        from src.rag.embeddings import EmbeddingService
-
-        pipeline = EvaluationPipeline(
-            llm_client=LLMClient(),
-            embedding_service=EmbeddingService(),
-        )
-
         result = await pipeline.evaluate(
             response_text=request.response_text,
             source_chunks=request.source_chunks,
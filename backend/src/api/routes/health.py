@@ -2,15 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+
 from fastapi import APIRouter, Depends
 
 from src.api.dependencies import get_orchestrator
-from src.core.config import get_settings
+from src.core.config import Settings, get_settings
 from src.models.schemas import ComponentHealth, HealthStatus
 from src.orchestration.workflow import QueryOrchestrator
 
 router = APIRouter(tags=["Health"])
 
+# Per-component budget; keeps a hung dependency from stalling the probe
+COMPONENT_CHECK_TIMEOUT_S = 2.0
+
+
+async def _check_vector_store(orchestrator: QueryOrchestrator) -> tuple[str, ComponentHealth]:
+    start = time.perf_counter()
+    stats = await orchestrator.vector_store.get_collection_stats()
+    return "vector_store", ComponentHealth(
+        status="healthy",
+        latency_ms=round((time.perf_counter() - start) * 1000, 2),
+        details=f"{stats.get('total_chunks', 0)} chunks indexed",
+    )
+
+
+async def _check_llm(settings: Settings) -> tuple[str, ComponentHealth]:
+    has_api_key = bool(settings.openai_api_key.get_secret_value())
+    return "llm_api", ComponentHealth(
+        status="healthy" if has_api_key else "degraded",
+        details="API key configured" if has_api_key else "No API key set",
+    )
+
 
 @router.get("/health", response_model=HealthStatus)
 async def health_check(
@@ -18,34 +42,35 @@ async def health_check(
 ) -> HealthStatus:
     """System health check with component-level status.
 
-    Checks:
+    Checks (run concurrently, each bounded by a timeout):
     - Vector store connectivity
     - LLM API availability (via ping)
     - Application configuration validity
     """
     settings = get_settings()
-    components: dict[str, ComponentHealth] = {}
 
-    # Check vector store
-    try:
-        stats = await orchestrator.vector_store.get_collection_stats()
-        components["vector_store"] = ComponentHealth(
-            status="healthy",
-            details=f"{stats.get('total_chunks', 0)} chunks indexed",
-        )
-    except Exception as e:
-        components["vector_store"] = ComponentHealth(
-            status="unhealthy",
-            details=str(e),
-        )
-
-    # Check LLM API key configured
-    has_api_key = bool(settings.openai_api_key.get_secret_value())
-    components["llm_api"] = ComponentHealth(
-        status="healthy" if has_api_key else "degraded",
-        details="API key configured" if has_api_key else "No API key set",
+    checks = {
+        "vector_store": _check_vector_store(orchestrator),
+        "llm_api": _check_llm(settings),
+    }
+    results = await asyncio.gather(
+        *(asyncio.wait_for(c, timeout=COMPONENT_CHECK_TIMEOUT_S) for c in checks.values()),
+        return_exceptions=True,
     )
 
+    components: dict[str, ComponentHealth] = {}
+    for name, result in zip(checks, results, strict=True):
+        if isinstance(result, BaseException):
+            details = (
+                f"Check timed out after {COMPONENT_CHECK_TIMEOUT_S}s"
+                if isinstance(result, TimeoutError)
+                else str(result)
+            )
+            components[name] = ComponentHealth(status="unhealthy", details=details)
+        else:
+            component_name, health = result
+            components[component_name] = health
+
     # Overall status
     all_healthy = all(c.status == "healthy" for c in components.values())
 
@@ -55,15 +80,3 @@ async def health_check(
         environment=settings.app_env.value,
         components=components,
     )
-
-
-@router.get("/ready")
-async def readiness_check() -> dict[str, str]:
-    """Kubernetes readiness probe endpoint."""
-    return {"status": "ready"}
-
-
-@router.get("/live")
-async def liveness_check() -> dict[str, str]:
-    """Kubernetes liveness probe endpoint."""
-    return {"status": "alive"}
@@ -7,6 +7,7 @@ Handles:
 
 from __future__ import annotations
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 
@@ -16,6 +17,10 @@ from src.orchestration.workflow import QueryOrchestrator
 
 router = APIRouter(prefix="/api/v1/query", tags=["Query"])
 
+# Keep caches and reverse proxies (nginx) from holding back streamed events
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+SSE_DONE = b"data: [DONE]\n\n"
+
 
 @router.post("/", response_model=QueryResponse)
 async def query_financial_insights(
@@ -51,26 +56,30 @@ async def stream_query(
     request: QueryRequest,
     orchestrator: QueryOrchestrator = Depends(get_orchestrator),
 ) -> StreamingResponse:
-    """Stream a financial query response token-by-token.
+    """Stream a financial query response as server-sent events.
+
+    Each event carries a JSON object: ``{"text": ...}`` for response text or
+    ``{"error": ...}`` on failure. The stream ends with ``data: [DONE]``.
 
     Note: Streaming mode skips evaluation (no quality scores).
     Use the synchronous endpoint for evaluated responses.
     """
-    request.include_evaluation = False
-    request.stream = True
 
     async def event_generator():
         try:
-            # For streaming, we do retrieval first then stream generation
-            response = await orchestrator.execute(request)
-            # In a full implementation, this would stream tokens directly
-            # For now, yield the complete response
-            yield f"data: {response.response}\n\n"
-            yield "data: [DONE]\n\n"
+            async for text in orchestrator.stream(request):
+                yield _sse_event({"text": text})
+            yield SSE_DONE
         except Exception as e:
-            yield f"data: [ERROR] {e}\n\n"
+            yield _sse_event({"error": str(e)})
 
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
+        headers=SSE_HEADERS,
     )
+
+
+def _sse_event(payload: dict[str, str]) -> bytes:
+    # JSON escapes newlines, so every event fits on a single data: line
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
@@ -28,6 +28,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # Application
@@ -43,9 +44,20 @@ class Settings(BaseSettings):
     openai_api_key: SecretStr = Field(default=SecretStr(""))
     openai_model: str = "gpt-4-turbo-preview"
     openai_embedding_model: str = "text-embedding-3-small"
-    embedding_dimensions: int = 1536
+    # Shortened text-embedding-3 vectors; None keeps the model's native width
+    embedding_dimensions: int | None = None
     max_token_output: int = 4096
 
+    # LLM response cache
+    llm_cache_enabled: bool = True
+    llm_cache_max_entries: int = 1024
+    llm_cache_ttl_seconds: int = 3600
+    # Semantic reuse answers paraphrases from cache; off by default because
+    # near-identical questions can still ask for different facts
+    llm_cache_semantic_enabled: bool = False
+    llm_cache_similarity_threshold: float = 0.92
+    llm_cache_embedding_model: str = "BAAI/bge-small-en-v1.5"
+
     # Vector Store
     vector_store_provider: VectorStoreProvider = VectorStoreProvider.CHROMA
     chroma_persist_directory: str = "./chroma_db"
@@ -62,6 +74,9 @@ class Settings(BaseSettings):
     # SEC EDGAR
     sec_edgar_user_agent: str = "FinancialInsights research@example.com"
 
+    # Document upload
+    max_upload_size_mb: int = 50
+
     # Monitoring
     prometheus_enabled: bool = True
 
@@ -88,4 +103,9 @@ class Settings(BaseSettings):
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Process-wide settings, loaded and validated once.
+
+    The instance is frozen, so every caller sees the same values for the
+    life of the process.
+    """
     return Settings()
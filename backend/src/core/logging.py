@@ -2,34 +2,98 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import TextIO
 
+import orjson
 import structlog
 
 from src.core.config import get_settings
 
+# Bytes buffered on stdout before a write syscall; flushed whenever the
+# log queue drains, so output is never held back while the app is idle.
+LOG_BUFFER_SIZE = 8192
 
-def setup_logging() -> None:
-    """Configure structured logging for the application.
+_queue_listener: QueueListener | None = None
 
-    Uses JSON rendering in production and colored console output in development.
-    Attaches shared processors for timestamps, log level, and caller info.
+
+class _PassthroughQueueHandler(QueueHandler):
+    """Enqueues records untouched.
+
+    The stock ``prepare`` formats the record on the calling thread and
+    flattens structlog's event dict to a string; skipping it defers all
+    rendering to the listener thread.
     """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _DeferredFlushStreamHandler(logging.StreamHandler):
+    """Stream handler that leaves flushing to the queue listener."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingQueueListener(QueueListener):
+    """Flushes handlers only once the queue has drained."""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+def _buffered_stdout() -> TextIO:
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError):
+        return sys.stdout
+    return open(fd, "w", buffering=LOG_BUFFER_SIZE, encoding="utf-8", closefd=False)
+
+
+def _orjson_dumps(obj: object, **kwargs: object) -> str:
+    # ProcessorFormatter hands a str to the stdlib handler, so decode here
+    return orjson.dumps(obj, **kwargs).decode()
+
+
+def _capture_exc_info(
+    logger: object, method_name: str, event_dict: structlog.types.EventDict
+) -> structlog.types.EventDict:
+    # Records are rendered on the listener thread, where sys.exc_info() is empty
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+def _configure_structlog() -> structlog.stdlib.ProcessorFormatter:
+    """Configure structlog and return the formatter that renders its records."""
     settings = get_settings()
 
     shared_processors: list[structlog.types.Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.UnicodeDecoder(),
+        _capture_exc_info,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
     ]
 
+    # Stack rendering is only useful while debugging locally
+    if not settings.is_production and settings.log_level == "DEBUG":
+        shared_processors.append(structlog.processors.StackInfoRenderer())
+
     if settings.is_production:
         shared_processors.append(structlog.processors.format_exc_info)
-        renderer = structlog.processors.JSONRenderer()
+        renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     else:
         renderer = structlog.dev.ConsoleRenderer()
 
@@ -39,20 +103,23 @@ def setup_logging() -> None:
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below the configured level return before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(settings.log_level)
+        ),
         cache_logger_on_first_use=True,
     )
 
-    formatter = structlog.stdlib.ProcessorFormatter(
+    return structlog.stdlib.ProcessorFormatter(
         processors=[
             structlog.stdlib.ProcessorFormatter.remove_processors_meta,
             renderer,
         ],
     )
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
 
+def _configure_root_logger(handler: logging.Handler) -> None:
+    settings = get_settings()
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
     root_logger.addHandler(handler)
@@ -63,5 +130,48 @@ def setup_logging() -> None:
         logging.getLogger(name).setLevel(logging.WARNING)
 
 
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
+def setup_logging() -> None:
+    """Configure structured logging for the application.
+
+    Uses JSON rendering in production and colored console output in development.
+    Attaches shared processors for timestamps, log level, and caller info.
+    """
+    handler = _DeferredFlushStreamHandler(_buffered_stdout())
+    handler.setFormatter(_configure_structlog())
+
+    # Rendering and I/O happen on the listener thread, off the request path
+    global _queue_listener
+    shutdown_logging()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_listener = _BatchingQueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.unregister(shutdown_logging)
+    atexit.register(shutdown_logging)
+
+    _configure_root_logger(_PassthroughQueueHandler(log_queue))
+
+
+def setup_worker_logging() -> None:
+    """Configure logging in a worker process.
+
+    Workers have no queue listener of their own, so records are rendered
+    and written to stdout directly by the calling thread.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(_configure_structlog())
+    _configure_root_logger(handler)
+
+
+def shutdown_logging() -> None:
+    """Drain the log queue and flush buffered output."""
+    global _queue_listener
+    if _queue_listener is None:
+        return
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.flush()
+    _queue_listener = None
+
+
+def get_logger(name: str) -> structlog.typing.FilteringBoundLogger:
     return structlog.get_logger(name)
@@ -9,19 +9,31 @@ Uses a hybrid strategy combining:
 
 from __future__ import annotations
 
+import multiprocessing
+import os
 import re
 import uuid
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
 
 import tiktoken
 
 from src.core.config import get_settings
-from src.core.logging import get_logger
+from src.core.logging import get_logger, setup_worker_logging
 from src.document_processing.sec_parser import ParsedFiling, ParsedSection
 from src.models.schemas import DocumentChunk, DocumentMetadata, FilingType
 
 logger = get_logger(__name__)
 
+# Worker threads for tiktoken's batch encoder (the Rust core releases the GIL)
+ENCODE_THREADS = 8
+
+# Filings with at least this many sections are chunked across a process pool
+PARALLEL_SECTION_THRESHOLD = 4
+
+_FILING_TYPE_VALUES = frozenset(ft.value for ft in FilingType)
+
 # Financial-specific sentence boundaries (e.g., "ended Dec. 31, 2023")
 FINANCIAL_BOUNDARY_PATTERN = re.compile(
     r"(?<=[.!?])\s+(?=[A-Z])|"  # standard sentence boundary
@@ -31,7 +43,20 @@ FINANCIAL_BOUNDARY_PATTERN = re.compile(
 )
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def get_encoder() -> tiktoken.Encoding:
+    """Load the BPE ranks once per process and share them across chunkers."""
+    return tiktoken.encoding_for_model("gpt-4")
+
+
+@lru_cache(maxsize=256)
+def _section_prefix(company: str, ticker: str, filing_type: str, section: str) -> tuple[str, int]:
+    """Context prefix for a section and its token count, memoized per key."""
+    prefix = f"[{company} ({ticker}) | {filing_type} | {section}]\n\n"
+    return prefix, len(get_encoder().encode(prefix))
+
+
+@dataclass(slots=True)
 class ChunkingConfig:
     max_tokens: int = 512
     overlap_tokens: int = 64
@@ -49,7 +74,12 @@ class FinancialDocumentChunker:
             max_tokens=settings.chunk_size,
             overlap_tokens=settings.chunk_overlap,
         )
-        self._encoder = tiktoken.encoding_for_model("gpt-4")
+
+    @property
+    def _encoder(self) -> tiktoken.Encoding:
+        # Resolved on first use, so constructing a chunker (e.g. as a request
+        # dependency) never waits on loading the BPE ranks
+        return get_encoder()
 
     def chunk_filing(self, filing: ParsedFiling) -> list[DocumentChunk]:
         """Chunk a parsed SEC filing into document chunks with metadata.
@@ -63,9 +93,19 @@ class FinancialDocumentChunker:
         all_chunks: list[DocumentChunk] = []
         document_id = str(uuid.uuid4())
 
-        for section in filing.sections:
-            section_chunks = self._chunk_section(section, filing, document_id)
-            all_chunks.extend(section_chunks)
+        if len(filing.sections) >= PARALLEL_SECTION_THRESHOLD:
+            # Sections are independent; ship only the filing header fields
+            # to the workers, not the full text or the other sections.
+            header = replace(filing, sections=[], full_text="")
+            tasks = [
+                (self.config, section, header, document_id) for section in filing.sections
+            ]
+            for section_chunks in get_process_pool().map(_chunk_section_worker, tasks):
+                all_chunks.extend(section_chunks)
+        else:
+            for section in filing.sections:
+                section_chunks = self._chunk_section(section, filing, document_id)
+                all_chunks.extend(section_chunks)
 
         # Reindex chunks sequentially
         for i, chunk in enumerate(all_chunks):
@@ -85,13 +125,15 @@ class FinancialDocumentChunker:
         """Chunk arbitrary text content (non-SEC documents)."""
         document_id = document_id or str(uuid.uuid4())
         sentences = self._split_into_sentences(text)
-        chunks = self._merge_sentences_into_chunks(sentences)
+        sent_tokens = self._encoder.encode_batch(sentences, num_threads=ENCODE_THREADS)
+        sent_lens = [len(t) for t in sent_tokens]
+        chunks = self._merge_sentences_into_chunks(sentences, sent_lens, sent_tokens)
 
+        # Every field is produced here, so skip per-chunk pydantic validation
         result: list[DocumentChunk] = []
-        for i, chunk_text in enumerate(chunks):
-            token_count = len(self._encoder.encode(chunk_text))
+        for i, (chunk_text, token_count) in enumerate(chunks):
             result.append(
-                DocumentChunk(
+                DocumentChunk.model_construct(
                     document_id=document_id,
                     content=chunk_text,
                     metadata=metadata,
@@ -107,7 +149,7 @@ class FinancialDocumentChunker:
         """Chunk a single section, prepending section context to each chunk."""
         metadata = DocumentMetadata(
             filing_type=FilingType(filing.filing_type)
-            if filing.filing_type in [ft.value for ft in FilingType]
+            if filing.filing_type in _FILING_TYPE_VALUES
             else FilingType.OTHER,
             company_name=filing.company_name,
             ticker=filing.ticker,
@@ -117,27 +159,30 @@ class FinancialDocumentChunker:
 
         # Build section prefix for context injection
         section_prefix = ""
+        prefix_tokens = 0
         if self.config.add_section_context:
-            section_prefix = (
-                f"[{filing.company_name} ({filing.ticker}) | "
-                f"{filing.filing_type} | {section.section.value}]\n\n"
+            section_prefix, prefix_tokens = _section_prefix(
+                filing.company_name, filing.ticker, filing.filing_type, section.section.value
             )
 
-        # Split section content into sentences
+        # Split section content into sentences and tokenize them in one batch
         sentences = self._split_into_sentences(section.content)
+        sent_tokens = self._encoder.encode_batch(sentences, num_threads=ENCODE_THREADS)
+        sent_lens = [len(t) for t in sent_tokens]
 
         # Merge sentences into token-bounded chunks
         chunks_text = self._merge_sentences_into_chunks(
-            sentences, prefix_tokens=len(self._encoder.encode(section_prefix))
+            sentences, sent_lens, sent_tokens, prefix_tokens=prefix_tokens
         )
 
+        # Trusted internal values; construct without re-validating each chunk
         chunks: list[DocumentChunk] = []
-        for i, chunk_text in enumerate(chunks_text):
+        for i, (chunk_text, body_tokens) in enumerate(chunks_text):
             full_content = section_prefix + chunk_text if section_prefix else chunk_text
-            token_count = len(self._encoder.encode(full_content))
+            token_count = prefix_tokens + body_tokens
 
             chunks.append(
-                DocumentChunk(
+                DocumentChunk.model_construct(
                     document_id=document_id,
                     content=full_content,
                     metadata=metadata,
@@ -156,18 +201,18 @@ class FinancialDocumentChunker:
                     table_lines = table.split("\n")
                     sub_tables = self._split_table(table_lines, section_prefix)
                     chunks.extend(
-                        DocumentChunk(
+                        DocumentChunk.model_construct(
                             document_id=document_id,
                             content=st,
                             metadata=metadata,
                             chunk_index=len(chunks) + j,
-                            token_count=len(self._encoder.encode(st)),
+                            token_count=st_tokens,
                         )
-                        for j, st in enumerate(sub_tables)
+                        for j, (st, st_tokens) in enumerate(sub_tables)
                     )
                 else:
                     chunks.append(
-                        DocumentChunk(
+                        DocumentChunk.model_construct(
                             document_id=document_id,
                             content=table_content,
                             metadata=metadata,
@@ -180,92 +225,163 @@ class FinancialDocumentChunker:
 
     def _split_into_sentences(self, text: str) -> list[str]:
         """Split text into sentences using financial-aware boundaries."""
-        parts = FINANCIAL_BOUNDARY_PATTERN.split(text)
-        return [s.strip() for s in parts if s and s.strip()]
+        sentences: list[str] = []
+        prev = 0
+        for match in FINANCIAL_BOUNDARY_PATTERN.finditer(text):
+            segment = text[prev : match.start()].strip()
+            if segment:
+                sentences.append(segment)
+            prev = match.end()
+        tail = text[prev:].strip()
+        if tail:
+            sentences.append(tail)
+        return sentences
 
     def _merge_sentences_into_chunks(
-        self, sentences: list[str], prefix_tokens: int = 0
-    ) -> list[str]:
-        """Merge sentences into chunks respecting token limits with overlap."""
+        self,
+        sentences: list[str],
+        sent_lens: list[int],
+        sent_tokens: list[list[int]],
+        prefix_tokens: int = 0,
+    ) -> list[tuple[str, int]]:
+        """Merge sentences into chunks respecting token limits with overlap.
+
+        Token counts are taken from the pre-computed ``sent_lens`` /
+        ``sent_tokens`` (one batched encode per section), so no encoding
+        happens here. Returns ``(chunk_text, token_count)`` pairs where the
+        count excludes ``prefix_tokens``.
+        """
         if not sentences:
             return []
 
         max_tokens = self.config.max_tokens - prefix_tokens
         overlap_tokens = self.config.overlap_tokens
-        chunks: list[str] = []
+        chunks: list[tuple[str, int]] = []
         current_sentences: list[str] = []
+        current_lens: list[int] = []
         current_tokens = 0
 
-        for sentence in sentences:
-            sentence_tokens = len(self._encoder.encode(sentence))
-
+        for sentence, sentence_tokens, tokens in zip(
+            sentences, sent_lens, sent_tokens, strict=True
+        ):
             if sentence_tokens > max_tokens:
                 # Single sentence exceeds limit - force split by tokens
                 if current_sentences:
-                    chunks.append(" ".join(current_sentences))
+                    chunks.append((" ".join(current_sentences), current_tokens))
                     current_sentences = []
+                    current_lens = []
                     current_tokens = 0
-                # Token-level split for oversized sentences
-                tokens = self._encoder.encode(sentence)
-                for start in range(0, len(tokens), max_tokens - overlap_tokens):
-                    chunk_tokens = tokens[start : start + max_tokens]
-                    chunks.append(self._encoder.decode(chunk_tokens))
+                # Token-level split for oversized sentences, decoded in one batch
+                windows = [
+                    tokens[start : start + max_tokens]
+                    for start in range(0, len(tokens), max_tokens - overlap_tokens)
+                ]
+                decoded = self._encoder.decode_batch(windows, num_threads=ENCODE_THREADS)
+                chunks.extend(zip(decoded, map(len, windows), strict=True))
                 continue
 
             if current_tokens + sentence_tokens > max_tokens:
                 # Flush current chunk
-                chunks.append(" ".join(current_sentences))
+                chunks.append((" ".join(current_sentences), current_tokens))
 
                 # Calculate overlap: take sentences from the end
-                overlap_sents: list[str] = []
                 overlap_count = 0
-                for s in reversed(current_sentences):
-                    s_tokens = len(self._encoder.encode(s))
+                keep = 0
+                for s_tokens in reversed(current_lens):
                     if overlap_count + s_tokens > overlap_tokens:
                         break
-                    overlap_sents.insert(0, s)
                     overlap_count += s_tokens
+                    keep += 1
 
-                current_sentences = overlap_sents
+                current_sentences = current_sentences[len(current_sentences) - keep :]
+                current_lens = current_lens[len(current_lens) - keep :]
                 current_tokens = overlap_count
 
             current_sentences.append(sentence)
+            current_lens.append(sentence_tokens)
             current_tokens += sentence_tokens
 
         if current_sentences:
-            text = " ".join(current_sentences)
-            if len(self._encoder.encode(text)) >= self.config.min_chunk_tokens:
-                chunks.append(text)
+            if current_tokens >= self.config.min_chunk_tokens:
+                chunks.append((" ".join(current_sentences), current_tokens))
             elif chunks:
-                # Merge small trailing chunk with previous
-                chunks[-1] = chunks[-1] + " " + text
+                # Merge small trailing chunk with previous in a single join
+                prev_text, prev_tokens = chunks[-1]
+                chunks[-1] = (
+                    " ".join((prev_text, *current_sentences)),
+                    prev_tokens + current_tokens,
+                )
 
         return chunks
 
-    def _split_table(self, table_lines: list[str], prefix: str) -> list[str]:
-        """Split a large table into smaller chunks preserving the header row."""
+    def _split_table(self, table_lines: list[str], prefix: str) -> list[tuple[str, int]]:
+        """Split a large table into smaller chunks preserving the header row.
+
+        Data-row token counts come from one batched encode; the loop itself
+        only does additions. Returns ``(sub_table, token_count)`` pairs.
+        """
         if not table_lines:
             return []
 
         header = table_lines[0]
         max_tokens = self.config.max_tokens
-
-        sub_tables: list[str] = []
+        header_base = len(self._encoder.encode(prefix + f"[TABLE]\n{header}"))
+        closing_tokens = len(self._encoder.encode("\n[/TABLE]"))
+        line_tok_lens = [
+            len(t)
+            for t in self._encoder.encode_batch(table_lines[1:], num_threads=ENCODE_THREADS)
+        ]
+
+        sub_tables: list[tuple[str, int]] = []
         current_lines = [header]
-        current_tokens = len(self._encoder.encode(prefix + f"[TABLE]\n{header}"))
+        current_tokens = header_base
 
-        for line in table_lines[1:]:
-            line_tokens = len(self._encoder.encode(line))
+        for line, line_tokens in zip(table_lines[1:], line_tok_lens, strict=True):
             if current_tokens + line_tokens > max_tokens - 10:
                 content = prefix + "[TABLE]\n" + "\n".join(current_lines) + "\n[/TABLE]"
-                sub_tables.append(content)
+                # One newline token per joined data row plus the closing tag
+                sub_tables.append(
+                    (content, current_tokens + len(current_lines) - 1 + closing_tokens)
+                )
                 current_lines = [header]
-                current_tokens = len(self._encoder.encode(prefix + f"[TABLE]\n{header}"))
+                current_tokens = header_base
             current_lines.append(line)
             current_tokens += line_tokens
 
         if len(current_lines) > 1:
             content = prefix + "[TABLE]\n" + "\n".join(current_lines) + "\n[/TABLE]"
-            sub_tables.append(content)
+            sub_tables.append(
+                (content, current_tokens + len(current_lines) - 1 + closing_tokens)
+            )
 
         return sub_tables
+
+
+@lru_cache(maxsize=1)
+def get_process_pool() -> ProcessPoolExecutor:
+    """Shared worker processes for CPU-bound document processing.
+
+    Workers start from a forkserver rather than forking the API process,
+    which would copy its threads' state (such as the log queue with no
+    listener draining it) into every worker.
+    """
+    return ProcessPoolExecutor(
+        max_workers=min(os.cpu_count() or 1, 8),
+        mp_context=multiprocessing.get_context("forkserver"),
+        initializer=setup_worker_logging,
+    )
+
+
+def shutdown_process_pool() -> None:
+    """Stop the shared worker processes if the pool was started."""
+    if get_process_pool.cache_info().currsize:
+        get_process_pool().shutdown()
+        get_process_pool.cache_clear()
+
+
+def _chunk_section_worker(
+    args: tuple[ChunkingConfig, ParsedSection, ParsedFiling, str],
+) -> list[DocumentChunk]:
+    """Process-pool entry point; module-level so it pickles cleanly."""
+    config, section, filing, document_id = args
+    return FinancialDocumentChunker(config)._chunk_section(section, filing, document_id)
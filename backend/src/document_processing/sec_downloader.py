@@ -6,8 +6,11 @@ Uses the sec-edgar-downloader library for reliable access.
 
 from __future__ import annotations
 
+import asyncio
 import tempfile
+from collections.abc import Awaitable, Callable, Generator
 from pathlib import Path
+from typing import TypeVar
 
 from sec_edgar_downloader import Downloader
 
@@ -17,6 +20,8 @@ from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 # Mapping from our filing types to SEC EDGAR form types
 FILING_TYPE_MAP = {
     "10-K": "10-K",
@@ -24,6 +29,9 @@ FILING_TYPE_MAP = {
     "8-K": "8-K",
 }
 
+# File extensions holding filing content in a sec-edgar-downloader tree
+FILING_SUFFIXES = frozenset({".txt", ".htm", ".html"})
+
 
 class SECEdgarDownloader:
     """Downloads SEC filings from EDGAR for a given company ticker."""
@@ -37,16 +45,21 @@ class SECEdgarDownloader:
         ticker: str,
         filing_type: str,
         num_filings: int = 1,
-    ) -> list[dict[str, str]]:
+    ) -> Generator[dict[str, str], None, None]:
         """Download SEC filings and return their content with metadata.
 
+        Filings are read lazily, one file at a time, so only the filing
+        currently being processed is held in memory. The download directory
+        is removed once the iterator is exhausted or closed. Async callers
+        should consume it through ``process_filings``.
+
         Args:
             ticker: Stock ticker symbol (e.g., 'AAPL').
             filing_type: Type of filing ('10-K', '10-Q', '8-K').
             num_filings: Number of most recent filings to download.
 
         Returns:
-            List of dicts with 'content', 'filing_type', 'ticker', etc.
+            Generator of dicts with 'content', 'filing_type', 'ticker', etc.
 
         Raises:
             DocumentProcessingError: If download or parsing fails.
@@ -65,8 +78,13 @@ class SECEdgarDownloader:
             num_filings=num_filings,
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            dl = Downloader(company_name="FinancialInsights", email_address=self._user_agent.split()[-1], download_folder=tmpdir)
+        tmpdir = tempfile.TemporaryDirectory()
+        try:
+            dl = Downloader(
+                company_name="FinancialInsights",
+                email_address=self._user_agent.split()[-1],
+                download_folder=tmpdir.name,
+            )
 
             try:
                 dl.get(form_type, ticker, limit=num_filings)
@@ -76,9 +94,13 @@ class SECEdgarDownloader:
                 ) from e
 
             # Find downloaded files
-            filings = self._collect_filings(Path(tmpdir), ticker, filing_type)
+            filing_paths = self._find_filing_files(Path(tmpdir.name), ticker)
+        except BaseException:
+            tmpdir.cleanup()
+            raise
 
-        if not filings:
+        if not filing_paths:
+            tmpdir.cleanup()
             raise DocumentProcessingError(
                 f"No {filing_type} filings found for {ticker}"
             )
@@ -86,58 +108,83 @@ class SECEdgarDownloader:
         logger.info(
             "filings_downloaded",
             ticker=ticker,
-            count=len(filings),
+            count=len(filing_paths),
         )
-        return filings
-
-    def _collect_filings(
-        self, download_dir: Path, ticker: str, filing_type: str
-    ) -> list[dict[str, str]]:
-        """Collect and read downloaded filing files."""
-        filings: list[dict[str, str]] = []
+        return self._iter_filings(tmpdir, filing_paths, ticker, filing_type)
 
+    @staticmethod
+    def _find_filing_files(download_dir: Path, ticker: str) -> list[Path]:
+        """List downloaded filing documents in a single directory walk."""
         # sec-edgar-downloader creates: download_dir/sec-edgar-filings/TICKER/TYPE/*/
         base = download_dir / "sec-edgar-filings" / ticker.upper()
 
         if not base.exists():
-            return filings
+            return []
 
-        for filing_dir in sorted(base.rglob("*.txt")):
-            try:
-                content = filing_dir.read_text(encoding="utf-8", errors="replace")
-                filings.append({
-                    "content": content,
-                    "filing_type": filing_type,
-                    "ticker": ticker.upper(),
-                    "company_name": ticker.upper(),
-                    "filing_date": "",
-                    "source_path": str(filing_dir),
-                })
-            except Exception as e:
-                logger.warning(
-                    "filing_read_error",
-                    path=str(filing_dir),
-                    error=str(e),
-                )
-
-        # Also check for htm/html files
-        for ext in ("*.htm", "*.html"):
-            for filing_file in sorted(base.rglob(ext)):
+        return sorted(p for p in base.rglob("*") if p.suffix in FILING_SUFFIXES)
+
+    def _iter_filings(
+        self,
+        tmpdir: tempfile.TemporaryDirectory[str],
+        filing_paths: list[Path],
+        ticker: str,
+        filing_type: str,
+    ) -> Generator[dict[str, str], None, None]:
+        """Read and yield downloaded filings one at a time."""
+        try:
+            for filing_file in filing_paths:
                 try:
                     content = filing_file.read_text(encoding="utf-8", errors="replace")
-                    filings.append({
-                        "content": content,
-                        "filing_type": filing_type,
-                        "ticker": ticker.upper(),
-                        "company_name": ticker.upper(),
-                        "filing_date": "",
-                        "source_path": str(filing_file),
-                    })
                 except Exception as e:
                     logger.warning(
                         "filing_read_error",
                         path=str(filing_file),
                         error=str(e),
                     )
+                    continue
+
+                yield {
+                    "content": content,
+                    "filing_type": filing_type,
+                    "ticker": ticker.upper(),
+                    "company_name": ticker.upper(),
+                    "filing_date": "",
+                    "source_path": str(filing_file),
+                }
+        finally:
+            tmpdir.cleanup()
+
+
+async def process_filings(
+    filings: Generator[dict[str, str], None, None],
+    process: Callable[[dict[str, str]], Awaitable[T]],
+    concurrency: int,
+) -> list[T | Exception]:
+    """Run ``process`` over downloaded filings with bounded concurrency.
+
+    Each of ``concurrency`` workers reads its next filing off the event loop
+    only once it is free, so at most that many filings are in memory at a
+    time. A filing whose processing fails contributes its exception instead
+    of a result. Results are in completion order. The generator is closed,
+    removing the download directory, when every worker is done.
+    """
+    results: list[T | Exception] = []
+    # Generators cannot be advanced from two threads at once
+    pull_lock = asyncio.Lock()
+
+    async def worker() -> None:
+        while True:
+            async with pull_lock:
+                filing_data = await asyncio.to_thread(next, filings, None)
+            if filing_data is None:
+                return
+            try:
+                results.append(await process(filing_data))
+            except Exception as e:
+                results.append(e)
 
-        return filings
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        await asyncio.to_thread(filings.close)
+    return results
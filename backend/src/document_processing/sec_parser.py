@@ -10,12 +10,21 @@ import re
 from dataclasses import dataclass, field
 from enum import Enum
 
-from bs4 import BeautifulSoup
+import ahocorasick
+from lxml import etree
 
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# HTML is handed to the streaming parser in slices of this many characters
+HTML_FEED_CHARS = 1 << 20
+
+# Elements whose text never reaches the cleaned output
+_SKIPPED_TAGS = frozenset({"script", "style"})
+
+_CELL_TAGS = frozenset({"td", "th"})
+
 
 class SECSection(str, Enum):
     """Standard sections in SEC filings with their Item numbers."""
@@ -70,6 +79,55 @@ SECTION_PATTERNS: dict[SECSection, list[re.Pattern[str]]] = {
 }
 
 
+# A word every pattern of the section contains. A filing whose lowercased
+# text lacks it (e.g. an 8-K without Item 1A) skips that section's patterns
+SECTION_KEYWORDS: dict[SECSection, str] = {
+    SECSection.RISK_FACTORS: "factors",
+    SECSection.MDA: "discussion",
+    SECSection.BUSINESS: "business",
+    SECSection.FINANCIAL_STATEMENTS: "statements",
+    SECSection.MDA_Q: "discussion",
+    SECSection.RISK_FACTORS_Q: "factors",
+}
+
+
+def _build_section_automaton(prefixes: set[str]) -> ahocorasick.Automaton:
+    automaton = ahocorasick.Automaton()
+    for prefix in prefixes:
+        automaton.add_word(prefix, prefix)
+    automaton.make_automaton()
+    return automaton
+
+
+# Lowercase literal each section regex begins with; a match can only start
+# where that literal occurs
+_PATTERN_PREFIXES: dict[re.Pattern[str], str] = {
+    pattern: re.match(r"[a-z]+", pattern.pattern).group()
+    for patterns in SECTION_PATTERNS.values()
+    for pattern in patterns
+}
+
+# Case-sensitive twins of SECTION_PATTERNS (whose sources are lowercase) for
+# matching against the already-lowercased text without per-char case folding
+_LOWERCASE_PATTERNS: dict[re.Pattern[str], re.Pattern[str]] = {
+    pattern: re.compile(pattern.pattern) for pattern in _PATTERN_PREFIXES
+}
+
+# Part before ".*" of the section regexes that have one. Once a match fails
+# at a candidate whose head ends at h, the tail was tried at every offset
+# from h to the end of that line, so later candidates whose head also ends
+# on that stretch cannot match either (each head here has a single end)
+_SPANNING_HEADS: dict[re.Pattern[str], re.Pattern[str]] = {
+    pattern: re.compile(pattern.pattern.split(".*", 1)[0])
+    for pattern in _PATTERN_PREFIXES
+    if ".*" in pattern.pattern
+}
+
+# One Aho-Corasick scan finds every candidate header start, so the regexes
+# are only tried at those offsets instead of each scanning the whole filing
+_SECTION_AC = _build_section_automaton(set(_PATTERN_PREFIXES.values()))
+
+
 @dataclass
 class ParsedSection:
     section: SECSection
@@ -109,11 +167,8 @@ class SECFilingParser:
             filing_type=filing_metadata.get("filing_type", ""),
         )
 
-        # Strip HTML tags but preserve structure
-        clean_text = self._clean_html(raw_content)
-
-        # Extract tables before stripping them
-        tables = self._extract_tables(raw_content)
+        # Strip HTML tags but preserve structure, collecting tables on the way
+        clean_text, tables = self._parse_html(raw_content)
 
         # Identify and extract sections
         sections = self._extract_sections(clean_text, tables)
@@ -146,45 +201,21 @@ class SECFilingParser:
         )
         return filing
 
-    def _clean_html(self, content: str) -> str:
-        """Remove HTML tags while preserving text structure."""
-        if "<" in content and ">" in content:
-            soup = BeautifulSoup(content, "lxml")
-            # Remove script and style elements
-            for element in soup(["script", "style"]):
-                element.decompose()
-            text = soup.get_text(separator="\n")
-        else:
-            text = content
+    def _parse_html(self, content: str) -> tuple[str, list[str]]:
+        """Strip HTML to structured text and extract its tables in one pass.
 
-        # Normalize whitespace while preserving paragraph breaks
-        lines = []
-        for line in text.split("\n"):
-            stripped = line.strip()
-            if stripped:
-                lines.append(stripped)
-            elif lines and lines[-1] != "":
-                lines.append("")
-
-        return "\n".join(lines)
-
-    def _extract_tables(self, content: str) -> list[str]:
-        """Extract financial tables from HTML content."""
-        tables: list[str] = []
-        if "<table" not in content.lower():
-            return tables
-
-        soup = BeautifulSoup(content, "lxml")
-        for table in soup.find_all("table"):
-            rows = []
-            for tr in table.find_all("tr"):
-                cells = [td.get_text(strip=True) for td in tr.find_all(["td", "th"])]
-                if any(cells):
-                    rows.append(" | ".join(cells))
-            if rows:
-                tables.append("\n".join(rows))
+        The markup is streamed through lxml's parser into a collector, so no
+        document tree is built for multi-megabyte filings.
+        """
+        if _looks_like_html(content):
+            parser = etree.HTMLParser(target=_HTMLCollector())
+            for start in range(0, len(content), HTML_FEED_CHARS):
+                parser.feed(content[start : start + HTML_FEED_CHARS])
+            text, tables = parser.close()
+        else:
+            text, tables = content, []
 
-        return tables
+        return _normalize_whitespace(text), tables
 
     def _extract_sections(
         self, text: str, tables: list[str]
@@ -192,11 +223,16 @@ class SECFilingParser:
         """Identify and extract named sections from filing text."""
         section_boundaries: list[tuple[int, SECSection, str]] = []
 
+        lowered = text.lower()
+        starts = _candidate_starts(text, lowered)
         for sec_type, patterns in SECTION_PATTERNS.items():
+            if SECTION_KEYWORDS[sec_type] not in lowered:
+                continue
             for pattern in patterns:
-                match = pattern.search(text)
-                if match:
-                    section_boundaries.append((match.start(), sec_type, match.group()))
+                span = _first_match(pattern, text, lowered, starts)
+                if span:
+                    start, end = span
+                    section_boundaries.append((start, sec_type, text[start:end]))
                     break  # take first match per section type
 
         if not section_boundaries:
@@ -213,7 +249,11 @@ class SECFilingParser:
                 if i + 1 < len(section_boundaries)
                 else len(text)
             )
-            content = text[start:end].strip()
+            # Headers start on a letter, so only trailing whitespace needs
+            # trimming; walking back first makes the slice the only copy
+            while end > start and text[end - 1].isspace():
+                end -= 1
+            content = text[start:end]
 
             # Attach relevant tables based on position heuristics
             section_tables = []
@@ -235,3 +275,155 @@ class SECFilingParser:
             )
 
         return sections
+
+
+def _looks_like_html(content: str) -> bool:
+    return "<" in content and ">" in content
+
+
+def _candidate_starts(text: str, lowered: str) -> dict[str, list[int]] | None:
+    """Offsets of every section-pattern prefix, from one pass over the text.
+
+    Returns None when lowercasing changes the text's length, since offsets
+    into the lowered copy would no longer line up with the original.
+    """
+    if len(lowered) != len(text):
+        return None
+
+    starts: dict[str, list[int]] = {prefix: [] for prefix in _PATTERN_PREFIXES.values()}
+    for end, prefix in _SECTION_AC.iter(lowered):
+        starts[prefix].append(end - len(prefix) + 1)
+    return starts
+
+
+def _first_match(
+    pattern: re.Pattern[str],
+    text: str,
+    lowered: str,
+    starts: dict[str, list[int]] | None,
+) -> tuple[int, int] | None:
+    """Span of the leftmost match of ``pattern``, trying only candidate offsets.
+
+    With candidate offsets, the lowercase twin of the pattern runs on the
+    lowercased text; the offsets are valid in both because lowercasing
+    preserved the length.
+    """
+    if starts is None:
+        match = pattern.search(text)
+        return match.span() if match else None
+
+    lowercase_pattern = _LOWERCASE_PATTERNS[pattern]
+    head = _SPANNING_HEADS.get(pattern)
+    # Stretch of the line on which a failed ".*" already tried every tail;
+    # skipping it keeps long lines dense with candidates linear, not quadratic
+    tried_from = tried_to = -1
+    for pos in starts[_PATTERN_PREFIXES[pattern]]:
+        if head is not None:
+            head_match = head.match(lowered, pos)
+            if head_match is None:
+                continue
+            head_end = head_match.end()
+            if tried_from <= head_end <= tried_to:
+                continue
+        match = lowercase_pattern.match(lowered, pos)
+        if match:
+            return match.span()
+        if head is not None:
+            tried_from = head_end
+            tried_to = lowered.find("\n", head_end)
+            if tried_to < 0:
+                tried_to = len(lowered)
+    return None
+
+
+def _normalize_whitespace(text: str) -> str:
+    """Strip every line and collapse runs of blank lines into one."""
+    lines = []
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if stripped:
+            lines.append(stripped)
+        elif lines and lines[-1] != "":
+            lines.append("")
+
+    return "\n".join(lines)
+
+
+class _HTMLCollector:
+    """lxml parser target that gathers text nodes and tables without a tree.
+
+    Character data is buffered until the next tag or comment, so each text
+    node comes out whole and in document order. Script and style contents
+    are dropped. A cell's text is every stripped text node beneath it, and
+    rows and cells of a nested table also count toward the enclosing one,
+    as a descendant search over the DOM would find them.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._buffer: list[str] = []
+        self._skip_depth = 0
+        # Tables are slotted on their start tag to keep document order
+        self._tables: list[str] = []
+        self._open_tables: list[tuple[int, list[list[list[str]]]]] = []
+        self._open_rows: list[list[list[str]]] = []
+        self._open_cells: list[list[str]] = []
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        self._flush()
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == "table":
+            self._open_tables.append((len(self._tables), []))
+            self._tables.append("")
+        elif tag == "tr":
+            row: list[list[str]] = []
+            for _, rows in self._open_tables:
+                rows.append(row)
+            self._open_rows.append(row)
+        elif tag in _CELL_TAGS:
+            cell: list[str] = []
+            for open_row in self._open_rows:
+                open_row.append(cell)
+            self._open_cells.append(cell)
+
+    def end(self, tag: str) -> None:
+        self._flush()
+        if tag in _SKIPPED_TAGS:
+            if self._skip_depth:
+                self._skip_depth -= 1
+        elif tag == "table" and self._open_tables:
+            slot, rows = self._open_tables.pop()
+            lines = []
+            for row in rows:
+                cells = ["".join(cell) for cell in row]
+                if any(cells):
+                    lines.append(" | ".join(cells))
+            self._tables[slot] = "\n".join(lines)
+        elif tag == "tr" and self._open_rows:
+            self._open_rows.pop()
+        elif tag in _CELL_TAGS and self._open_cells:
+            self._open_cells.pop()
+
+    def data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._buffer.append(data)
+
+    def comment(self, text: str) -> None:
+        self._flush()
+
+    def close(self) -> tuple[str, list[str]]:
+        self._flush()
+        return "\n".join(self._parts), [table for table in self._tables if table]
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        self._parts.append(text)
+        if self._open_cells:
+            stripped = text.strip()
+            if stripped:
+                for cell in self._open_cells:
+                    cell.append(stripped)
@@ -11,6 +11,9 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from itertools import islice
+
+import ahocorasick
 
 from src.core.logging import get_logger
 from src.models.schemas import Citation
@@ -43,8 +46,33 @@ HIGH_CONFIDENCE_SIGNALS = [
     r"(?:increased|decreased|grew|declined)\s+(?:by\s+)?\d",  # Quantified changes
 ]
 
+# Single-pass matchers built once at import time
+SPECIFICITY_RE = re.compile(
+    "|".join(f"(?:{p})" for p in HIGH_CONFIDENCE_SIGNALS), re.ASCII
+)
+CITATION_RE = re.compile(r"\[Source \d+\]", re.ASCII)
+
+# Number of specificity signals that earns the full specificity score
+SPECIFICITY_SATURATION = 5
+TERM_RE = re.compile(r"[a-z0-9]+")
+
+# Query words that carry no topical signal
+_STOPWORDS = frozenset({"what", "how", "why", "when", "is", "the", "a", "an", "of", "in", "for"})
+
+
+def _build_hedge_automaton() -> ahocorasick.Automaton:
+    automaton = ahocorasick.Automaton()
+    for phrase in HEDGING_PHRASES:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
 
-@dataclass
+# Hedging is a literal multi-string search; scan once with Aho-Corasick
+_HEDGE_AC = _build_hedge_automaton()
+
+
+@dataclass(slots=True)
 class ConfidenceResult:
     confidence_score: float  # 0.0 = no confidence, 1.0 = full confidence
     source_coverage_score: float
@@ -80,11 +108,67 @@ class ConfidenceScorer:
         Returns:
             ConfidenceResult with composite and component scores.
         """
+        return self._score(
+            self._text_features(response_text),
+            query,
+            citations,
+            source_chunks,
+            hallucination_score,
+            consistency_score,
+        )
+
+    def score_batch(
+        self,
+        responses: list[str],
+        queries: list[str],
+        citations: list[list[Citation]],
+        source_chunks: list[list[str]],
+        hallucination_scores: list[float] | None = None,
+        consistency_scores: list[float] | None = None,
+    ) -> list[ConfidenceResult]:
+        """Score several responses, extracting text features once per distinct response.
+
+        All lists are parallel; omitted score lists use the same defaults
+        as ``score``.
+        """
+        n = len(responses)
+        hallucination_scores = hallucination_scores or [0.0] * n
+        consistency_scores = consistency_scores or [1.0] * n
+        features = {text: self._text_features(text) for text in dict.fromkeys(responses)}
+
+        return [
+            self._score(features[text], query, cites, chunks, halluc, consist)
+            for text, query, cites, chunks, halluc, consist in zip(
+                responses,
+                queries,
+                citations,
+                source_chunks,
+                hallucination_scores,
+                consistency_scores,
+                strict=True,
+            )
+        ]
+
+    def _text_features(self, response_text: str) -> tuple[float, float, float]:
+        """(citation density, specificity, hedging) - depends only on the response."""
+        return (
+            self._score_citation_density(response_text),
+            self._score_specificity(response_text),
+            self._score_hedging_penalty(response_text),
+        )
+
+    def _score(
+        self,
+        text_features: tuple[float, float, float],
+        query: str,
+        citations: list[Citation],
+        source_chunks: list[str],
+        hallucination_score: float,
+        consistency_score: float,
+    ) -> ConfidenceResult:
         # Component scores
+        citation_density, specificity, hedging = text_features
         source_coverage = self._score_source_coverage(query, source_chunks)
-        citation_density = self._score_citation_density(response_text)
-        specificity = self._score_specificity(response_text)
-        hedging = self._score_hedging_penalty(response_text)
         retrieval_relevance = self._score_retrieval_relevance(citations)
 
         # Composite score with weights
@@ -130,19 +214,22 @@ class ConfidenceScorer:
         if not source_chunks:
             return 0.0
 
-        query_terms = set(query.lower().split())
-        query_terms -= {"what", "how", "why", "when", "is", "the", "a", "an", "of", "in", "for"}
+        query_terms = set(TERM_RE.findall(query.lower())) - _STOPWORDS
 
         if not query_terms:
             return 0.5
 
-        combined_sources = " ".join(source_chunks).lower()
-        matched = sum(1 for term in query_terms if term in combined_sources)
-        return matched / len(query_terms)
+        # Tokenize chunk by chunk and stop once every query term is covered
+        source_terms: set[str] = set()
+        for chunk in source_chunks:
+            source_terms.update(TERM_RE.findall(chunk.lower()))
+            if query_terms <= source_terms:
+                return 1.0
+        return len(query_terms & source_terms) / len(query_terms)
 
     def _score_citation_density(self, response_text: str) -> float:
         """Score based on how many citations appear relative to response length."""
-        citation_count = len(re.findall(r"\[Source \d+\]", response_text))
+        citation_count = sum(1 for _ in CITATION_RE.finditer(response_text))
         # Rough heuristic: ~1 citation per 100 words is good
         word_count = len(response_text.split())
         if word_count == 0:
@@ -154,18 +241,16 @@ class ConfidenceScorer:
 
     def _score_specificity(self, response_text: str) -> float:
         """Score based on presence of specific data points (numbers, dates, figures)."""
-        signal_count = 0
-        for pattern in HIGH_CONFIDENCE_SIGNALS:
-            matches = re.findall(pattern, response_text)
-            signal_count += len(matches)
-
-        # Normalize: 5+ specific data points = full score
-        return min(signal_count / 5.0, 1.0)
+        # Normalize: 5+ specific data points = full score, so stop scanning there
+        signal_count = sum(
+            1 for _ in islice(SPECIFICITY_RE.finditer(response_text), SPECIFICITY_SATURATION)
+        )
+        return signal_count / SPECIFICITY_SATURATION
 
     def _score_hedging_penalty(self, response_text: str) -> float:
         """Score penalty for hedging language (higher = more hedging = less confident)."""
-        text_lower = response_text.lower()
-        hedge_count = sum(1 for phrase in HEDGING_PHRASES if phrase in text_lower)
+        # Count distinct phrases, not occurrences
+        hedge_count = len({phrase for _, phrase in _HEDGE_AC.iter(response_text.lower())})
 
         # Normalize: 3+ hedging phrases = max penalty
         return min(hedge_count / 3.0, 1.0)
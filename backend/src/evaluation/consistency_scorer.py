@@ -8,11 +8,13 @@ potential hallucination or ambiguity.
 
 from __future__ import annotations
 
-import json
+import asyncio
 from dataclasses import dataclass
 
+import orjson
+
 from src.core.logging import get_logger
-from src.llm.client import LLMClient
+from src.llm.client import LLM_MAX_CONCURRENCY, LLMClient
 from src.llm.prompts import CONSISTENCY_CHECK_PROMPT
 
 logger = get_logger(__name__)
@@ -61,19 +63,20 @@ class ConsistencyScorer:
         Returns:
             ConsistencyResult with aggregate score and discrepancy details.
         """
-        # Generate additional samples with slightly higher temperature
-        alternative_responses: list[str] = []
-        for _ in range(num_samples):
-            try:
-                alt_response, _ = await self._llm.generate(
-                    messages=messages,
-                    temperature=0.3,  # slightly more variation
-                )
-                alternative_responses.append(alt_response)
-            except Exception as e:
-                logger.warning("consistency_sample_failed", error=str(e))
-
-        if not alternative_responses:
+        # Each sample is judged as soon as it arrives, so a fast sample's
+        # comparison overlaps the slower samples still generating. Each
+        # pipeline makes its calls one after the other, so capping pipelines
+        # keeps in-flight calls within the generate_many bound
+        concurrency = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+        async def bounded() -> dict[str, any] | None:
+            async with concurrency:
+                return await self._sample_and_compare(query, original_response, messages)
+
+        results = await asyncio.gather(*(bounded() for _ in range(num_samples)))
+        pair_results = [r for r in results if r is not None]
+
+        if not pair_results:
             return ConsistencyResult(
                 consistency_score=0.5,  # uncertain
                 num_samples=0,
@@ -81,14 +84,10 @@ class ConsistencyScorer:
                 reasoning="Could not generate alternative responses for comparison",
             )
 
-        # Compare original with each alternative
         pairwise_scores: list[float] = []
         all_discrepancies: list[str] = []
 
-        for alt_response in alternative_responses:
-            pair_result = await self._compare_pair(
-                query, original_response, alt_response
-            )
+        for pair_result in pair_results:
             pairwise_scores.append(pair_result["score"])
             all_discrepancies.extend(pair_result["discrepancies"])
 
@@ -96,9 +95,9 @@ class ConsistencyScorer:
 
         result = ConsistencyResult(
             consistency_score=round(avg_score, 4),
-            num_samples=len(alternative_responses),
+            num_samples=len(pair_results),
             discrepancies=all_discrepancies,
-            reasoning=f"Compared with {len(alternative_responses)} alternative responses. "
+            reasoning=f"Compared with {len(pair_results)} alternative responses. "
             f"Pairwise scores: {[round(s, 3) for s in pairwise_scores]}",
         )
 
@@ -111,11 +110,23 @@ class ConsistencyScorer:
 
         return result
 
+    async def _sample_and_compare(
+        self, query: str, original_response: str, messages: list[dict[str, str]]
+    ) -> dict[str, any] | None:
+        """Generate one alternative response and judge it against the original."""
+        try:
+            # Slightly higher temperature for more variation
+            alt_response, _ = await self._llm.generate(messages, temperature=0.3)
+        except Exception as e:
+            logger.warning("consistency_sample_failed", error=str(e))
+            return None
+        return await self._compare_pair(query, original_response, alt_response)
+
     async def _compare_pair(
         self, query: str, response_a: str, response_b: str
     ) -> dict[str, any]:
         """Compare two responses for semantic consistency using LLM judge."""
-        prompt = CONSISTENCY_CHECK_PROMPT.format(
+        prompt = CONSISTENCY_CHECK_PROMPT.substitute(
             query=query,
             response_a=response_a,
             response_b=response_b,
@@ -128,12 +139,12 @@ class ConsistencyScorer:
                 response_format={"type": "json_object"},
             )
 
-            parsed = json.loads(result_text)
+            parsed = orjson.loads(result_text)
             return {
                 "score": float(parsed.get("consistency_score", 0.5)),
                 "discrepancies": parsed.get("discrepancies", []),
             }
 
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
             logger.warning("consistency_comparison_parse_error", error=str(e))
             return {"score": 0.5, "discrepancies": [f"Parse error: {e}"]}
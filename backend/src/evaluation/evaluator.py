@@ -6,6 +6,8 @@ scoring into a single evaluation result with a pass/flag/fail verdict.
 
 from __future__ import annotations
 
+import asyncio
+
 from src.core.config import get_settings
 from src.core.logging import get_logger
 from src.evaluation.confidence_scorer import ConfidenceScorer
@@ -14,13 +16,19 @@ from src.evaluation.hallucination_detector import HallucinationDetector
 from src.llm.client import LLMClient
 from src.models.schemas import Citation, EvaluationResult, EvaluationStatus
 from src.monitoring.metrics import (
-    EVALUATION_SCORES,
+    CONFIDENCE_SCORE,
+    CONSISTENCY_SCORE,
     EVALUATION_STATUS_COUNTER,
+    HALLUCINATION_SCORE,
+    labeled,
 )
 from src.rag.embeddings import EmbeddingService
 
 logger = get_logger(__name__)
 
+# Hallucination score above which a response fails regardless of other stages
+HARD_FAIL_HALLUCINATION_SCORE = 0.8
+
 
 class EvaluationPipeline:
     """Orchestrates the full LLM output evaluation pipeline.
@@ -66,11 +74,36 @@ class EvaluationPipeline:
         """
         flags: list[str] = []
 
-        # Stage 1: Hallucination detection
-        hallucination = await self._hallucination_detector.detect(
-            response_text, source_chunks, query
-        )
+        # Stages 1 and 2 are independent LLM round-trips; run them together
+        consistency_task = None
+        if run_consistency and messages:
+            consistency_task = asyncio.ensure_future(
+                self._consistency_scorer.score(
+                    original_response=response_text,
+                    messages=messages,
+                    query=query,
+                )
+            )
+        try:
+            hallucination = await self._hallucination_detector.detect(
+                response_text, source_chunks, query
+            )
+        except BaseException:
+            if consistency_task is not None:
+                consistency_task.cancel()
+            raise
+
+        consistency = None
+        if consistency_task is not None:
+            if hallucination.hallucination_score > HARD_FAIL_HALLUCINATION_SCORE:
+                # The verdict is already FAILED; drop the remaining sample and
+                # judge calls instead of waiting on them
+                consistency_task.cancel()
+                await asyncio.gather(consistency_task, return_exceptions=True)
+            else:
+                consistency = await consistency_task
 
+        # Stage 1: Hallucination detection
         if hallucination.hallucination_score > self._settings.hallucination_threshold:
             flags.append(
                 f"High hallucination score: {hallucination.hallucination_score:.2f}"
@@ -78,12 +111,7 @@ class EvaluationPipeline:
 
         # Stage 2: Consistency scoring (optional, expensive)
         consistency_score = 1.0
-        if run_consistency and messages:
-            consistency = await self._consistency_scorer.score(
-                original_response=response_text,
-                messages=messages,
-                query=query,
-            )
+        if consistency is not None:
             consistency_score = consistency.consistency_score
 
             if consistency_score < self._settings.consistency_threshold:
@@ -137,14 +165,10 @@ class EvaluationPipeline:
         )
 
         # Track metrics
-        EVALUATION_SCORES.labels(metric="hallucination").observe(
-            hallucination.hallucination_score
-        )
-        EVALUATION_SCORES.labels(metric="consistency").observe(consistency_score)
-        EVALUATION_SCORES.labels(metric="confidence").observe(
-            confidence.confidence_score
-        )
-        EVALUATION_STATUS_COUNTER.labels(status=status.value).inc()
+        HALLUCINATION_SCORE.observe(hallucination.hallucination_score)
+        CONSISTENCY_SCORE.observe(consistency_score)
+        CONFIDENCE_SCORE.observe(confidence.confidence_score)
+        labeled(EVALUATION_STATUS_COUNTER, status=status.value).inc()
 
         logger.info(
             "evaluation_complete",
@@ -166,7 +190,7 @@ class EvaluationPipeline:
     ) -> EvaluationStatus:
         """Determine pass/flag/fail status based on thresholds."""
         # Hard fail: high hallucination
-        if hallucination_score > 0.8:
+        if hallucination_score > HARD_FAIL_HALLUCINATION_SCORE:
             return EvaluationStatus.FAILED
 
         # Fail: multiple quality issues
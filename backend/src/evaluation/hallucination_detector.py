@@ -11,9 +11,12 @@ This produces a hallucination score used for quality gating.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
+
+import orjson
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
@@ -23,6 +26,22 @@ from src.rag.embeddings import EmbeddingService
 
 logger = get_logger(__name__)
 
+# Financial entity patterns. None has capturing groups, so findall returns
+# the matched strings directly without building a Match object per hit
+# Dollar amounts: $1.5B, $500M, $1,234.56
+_MONEY_PATTERN = re.compile(r'\$[\d,]+\.?\d*\s*[BMKbmk]?(?:illion|illion)?')
+# Percentages: 15.3%, -2.1%
+_PERCENT_PATTERN = re.compile(r'-?[\d.]+%')
+# Dates: Q1 2024, FY2023, December 31, 2023
+_DATE_PATTERN = re.compile(r'(?:Q[1-4]\s*\d{4}|FY\d{4}|\d{4})')
+# Large numbers with context
+_LARGE_NUMBER_PATTERN = re.compile(r'\b\d{1,3}(?:,\d{3})+(?:\.\d+)?\b')
+_HAS_DIGIT = re.compile(r'\d')
+
+# Distinct retrieved-chunk sets whose extracted entities are kept; the same
+# chunks are typically judged against several responses
+SOURCE_ENTITY_CACHE_SIZE = 256
+
 
 @dataclass
 class ClaimVerification:
@@ -76,15 +95,13 @@ class HallucinationDetector:
         Returns:
             HallucinationResult with scores and claim-level details.
         """
-        # Run all detection strategies in parallel conceptually
-        # (in practice, LLM call is the bottleneck)
-        llm_result = await self._llm_judge_verification(
-            response_text, source_chunks, query
+        # The judge call and the embedding call are independent round-trips,
+        # so latency is the slower of the two rather than their sum
+        llm_result, semantic_score = await asyncio.gather(
+            self._llm_judge_verification(response_text, source_chunks, query),
+            self._semantic_similarity_check(response_text, source_chunks),
         )
         entity_score = self._entity_overlap_check(response_text, source_chunks)
-        semantic_score = await self._semantic_similarity_check(
-            response_text, source_chunks
-        )
 
         # Combine scores with weighted average
         # LLM judge is most reliable, entity overlap catches numerical errors
@@ -130,7 +147,7 @@ class HallucinationDetector:
             f"[Source {i+1}]\n{chunk}" for i, chunk in enumerate(source_chunks)
         )
 
-        prompt = HALLUCINATION_CHECK_PROMPT.format(
+        prompt = HALLUCINATION_CHECK_PROMPT.substitute(
             context=context,
             response=response_text,
             query=query,
@@ -143,7 +160,7 @@ class HallucinationDetector:
                 response_format={"type": "json_object"},
             )
 
-            parsed = json.loads(result_text)
+            parsed = orjson.loads(result_text)
 
             claims = [
                 ClaimVerification(
@@ -162,7 +179,7 @@ class HallucinationDetector:
                 reasoning=parsed.get("reasoning", ""),
             )
 
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
             logger.warning("llm_judge_parse_error", error=str(e))
             return HallucinationResult(
                 hallucination_score=0.5,
@@ -182,14 +199,13 @@ class HallucinationDetector:
         if not response_entities:
             return 1.0  # No entities to verify
 
-        source_text = " ".join(source_chunks)
-        source_entities = self._extract_financial_entities(source_text)
+        source_entities = _source_entities(tuple(source_chunks))
 
         if not source_entities:
             return 0.5  # Can't verify
 
         # Check what fraction of response entities appear in sources
-        matched = sum(1 for e in response_entities if e in source_entities)
+        matched = len(response_entities & source_entities)
         return matched / len(response_entities)
 
     async def _semantic_similarity_check(
@@ -200,16 +216,17 @@ class HallucinationDetector:
             return 0.0
 
         try:
-            response_embedding = await self._embeddings.embed_query(response_text)
-            chunk_embeddings = await self._embeddings.embed_texts(source_chunks)
+            # One request covers the response and every source chunk
+            response_embedding, *chunk_embeddings = await self._embeddings.embed_texts(
+                [response_text, *source_chunks]
+            )
 
-            similarities = [
-                EmbeddingService.cosine_similarity(response_embedding, ce)
-                for ce in chunk_embeddings
-            ]
+            similarities = EmbeddingService.cosine_similarities(
+                response_embedding, chunk_embeddings
+            )
 
             # Use max similarity (best matching chunk) rather than average
-            return max(similarities) if similarities else 0.0
+            return float(similarities.max())
 
         except Exception as e:
             logger.warning("semantic_similarity_error", error=str(e))
@@ -218,22 +235,21 @@ class HallucinationDetector:
     @staticmethod
     def _extract_financial_entities(text: str) -> set[str]:
         """Extract financial entities: dollar amounts, percentages, dates, tickers."""
-        entities: set[str] = set()
-
-        # Dollar amounts: $1.5B, $500M, $1,234.56
-        for match in re.finditer(r'\$[\d,]+\.?\d*\s*[BMKbmk]?(?:illion|illion)?', text):
-            entities.add(match.group().strip().lower())
-
-        # Percentages: 15.3%, -2.1%
-        for match in re.finditer(r'-?[\d.]+%', text):
-            entities.add(match.group())
+        # Every entity contains a digit; prose without one needs no scanning
+        if not _HAS_DIGIT.search(text):
+            return set()
 
-        # Dates: Q1 2024, FY2023, December 31, 2023
-        for match in re.finditer(r'(?:Q[1-4]\s*\d{4}|FY\d{4}|\d{4})', text):
-            entities.add(match.group())
+        # Money and percentages need their symbol; skip those scans without it
+        entities = (
+            {m.strip().lower() for m in _MONEY_PATTERN.findall(text)} if "$" in text else set()
+        )
+        if "%" in text:
+            entities.update(_PERCENT_PATTERN.findall(text))
+        entities.update(_DATE_PATTERN.findall(text))
+        entities.update(_LARGE_NUMBER_PATTERN.findall(text))
+        return entities
 
-        # Large numbers with context
-        for match in re.finditer(r'\b\d{1,3}(?:,\d{3})+(?:\.\d+)?\b', text):
-            entities.add(match.group())
 
-        return entities
+@lru_cache(maxsize=SOURCE_ENTITY_CACHE_SIZE)
+def _source_entities(source_chunks: tuple[str, ...]) -> frozenset[str]:
+    return frozenset(HallucinationDetector._extract_financial_entities(" ".join(source_chunks)))
@@ -9,12 +9,15 @@ Enforces financial domain constraints:
 
 from __future__ import annotations
 
+import hashlib
 import re
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
+from src.guardrails.pattern_prefilter import PatternPrefilter, fold_case
 
 logger = get_logger(__name__)
 
@@ -59,6 +62,32 @@ FORWARD_LOOKING_PATTERNS = [
     re.compile(r'\b(?:guidance\s+(?:of|for|suggests|indicates))', re.IGNORECASE),
 ]
 
+# Every pattern above as one alternation, used when the Hyperscan prefilter
+# cannot decide. Clean responses, the common case, are rejected in a single
+# scan; otherwise no pattern can match before its first hit, so the
+# per-pattern passes start there
+_ANY_VIOLATION = re.compile(
+    "|".join(f"(?:{p.pattern})" for p in INVESTMENT_ADVICE_PATTERNS + FORWARD_LOOKING_PATTERNS),
+    re.IGNORECASE,
+)
+
+# Words every match in the pattern group contains one of. Without Hyperscan,
+# a response containing none of a group's words skips that group's scans
+INVESTMENT_ADVICE_ANCHORS = ("buy", "sell", "hold", "invest", "stock", "perform", "price")
+FORWARD_LOOKING_ANCHORS = (
+    "likely", "probably", "definitely",
+    "expected", "projected", "forecast", "anticipated", "future", "guidance",
+)
+_ANCHORED_GROUPS = (
+    (INVESTMENT_ADVICE_ANCHORS, frozenset(INVESTMENT_ADVICE_PATTERNS)),
+    (FORWARD_LOOKING_ANCHORS, frozenset(FORWARD_LOOKING_PATTERNS)),
+)
+
+# Filter results kept for repeated texts (retries, cached LLM answers, replays),
+# keyed by digest; longer texts are not memoized so the cache stays small
+RESULT_CACHE_SIZE = 256
+MAX_CACHED_TEXT_CHARS = 64_000
+
 # Forward-looking disclaimer
 FLS_DISCLAIMER = (
     "\n\n---\n*This analysis contains forward-looking statements based on "
@@ -74,12 +103,20 @@ class ContentFilter:
         settings = get_settings()
         self._enabled = settings.content_filter_enabled
         self._max_tokens = settings.max_token_output
+        self._prefilter = PatternPrefilter(INVESTMENT_ADVICE_PATTERNS + FORWARD_LOOKING_PATTERNS)
+        self._results: OrderedDict[tuple[bytes, bool], FilterResult] = OrderedDict()
 
-    def filter(self, text: str) -> FilterResult:
+    def filter(
+        self, text: str, append_disclaimer: bool = True, cache: bool = True
+    ) -> FilterResult:
         """Apply all content filters to the generated text.
 
         Args:
             text: LLM-generated response text.
+            append_disclaimer: Append the forward-looking disclaimer when
+                needed. Streaming callers filter piecewise and append it once.
+            cache: Memoize the result. Streaming callers filter line by line
+                and pass False so one-off lines do not churn the cache.
 
         Returns:
             FilterResult with pass/fail status and any violations.
@@ -87,16 +124,52 @@ class ContentFilter:
         if not self._enabled:
             return FilterResult(passed=True, filtered_text=text)
 
+        if not cache or len(text) > MAX_CACHED_TEXT_CHARS:
+            return self._apply_filters(text, append_disclaimer)
+
+        key = (hashlib.blake2b(text.encode(), digest_size=16).digest(), append_disclaimer)
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+        else:
+            result = self._apply_filters(text, append_disclaimer)
+            self._results[key] = result
+            if len(self._results) > RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+
+        # Callers get their own lists so the cached result cannot be mutated
+        return replace(result, violations=list(result.violations), warnings=list(result.warnings))
+
+    def _apply_filters(self, text: str, append_disclaimer: bool) -> FilterResult:
         violations: list[Violation] = []
         warnings: list[str] = []
 
-        # Check for investment advice (blocking violation)
-        advice_violations = self._check_investment_advice(text)
-        violations.extend(advice_violations)
-
-        # Check for forward-looking statements (warning + disclaimer)
-        fls_violations = self._check_forward_looking(text)
-        violations.extend(fls_violations)
+        candidates = self._prefilter.candidates(text)
+        start = 0
+        if candidates is None:
+            folded = fold_case(text)
+            candidates = frozenset().union(
+                *(
+                    group
+                    for anchors, group in _ANCHORED_GROUPS
+                    if any(anchor in folded for anchor in anchors)
+                )
+            )
+            if candidates:
+                first_hit = _ANY_VIOLATION.search(text)
+                if first_hit:
+                    start = first_hit.start()
+                else:
+                    candidates = frozenset()
+
+        if candidates:
+            # Check for investment advice (blocking violation)
+            advice_violations = self._check_investment_advice(text, candidates, start)
+            violations.extend(advice_violations)
+
+            # Check for forward-looking statements (warning + disclaimer)
+            fls_violations = self._check_forward_looking(text, candidates, start)
+            violations.extend(fls_violations)
 
         # Check token limit
         if len(text.split()) > self._max_tokens:
@@ -124,7 +197,7 @@ class ContentFilter:
                     )
             warnings.append("Investment advice content was removed from the response.")
 
-        if has_fls:
+        if has_fls and append_disclaimer:
             # Append forward-looking disclaimer
             filtered_text += FLS_DISCLAIMER
             warnings.append("Forward-looking statement disclaimer added.")
@@ -146,10 +219,14 @@ class ContentFilter:
             filtered_text=filtered_text,
         )
 
-    def _check_investment_advice(self, text: str) -> list[Violation]:
+    def _check_investment_advice(
+        self, text: str, candidates: frozenset[re.Pattern[str]], start: int = 0
+    ) -> list[Violation]:
         violations: list[Violation] = []
         for pattern in INVESTMENT_ADVICE_PATTERNS:
-            for match in pattern.finditer(text):
+            if pattern not in candidates:
+                continue
+            for match in pattern.finditer(text, start):
                 violations.append(
                     Violation(
                         violation_type=ViolationType.INVESTMENT_ADVICE,
@@ -160,10 +237,14 @@ class ContentFilter:
                 )
         return violations
 
-    def _check_forward_looking(self, text: str) -> list[Violation]:
+    def _check_forward_looking(
+        self, text: str, candidates: frozenset[re.Pattern[str]], start: int = 0
+    ) -> list[Violation]:
         violations: list[Violation] = []
         for pattern in FORWARD_LOOKING_PATTERNS:
-            for match in pattern.finditer(text):
+            if pattern not in candidates:
+                continue
+            for match in pattern.finditer(text, start):
                 violations.append(
                     Violation(
                         violation_type=ViolationType.FORWARD_LOOKING,
@@ -0,0 +1,143 @@
+"""Optional Hyperscan prefilter for the guardrail regex sets.
+
+Hyperscan compiles a whole pattern set into one automaton and reports which
+of the patterns occur in a single native pass over the text. Matching itself
+stays with ``re``: the prefilter only tells callers which patterns are worth
+running, so reported matches are exactly those of the stdlib patterns.
+
+Only ASCII text is prefiltered. Beyond ASCII the two engines disagree on
+``\\d``, ``\\s`` and case folding, so callers fall back to a literal check
+with ``fold_case``, as they do when hyperscan is not installed.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+import threading
+from collections.abc import Iterable
+from typing import Any
+
+from src.core.logging import get_logger
+
+try:
+    import hyperscan
+except ImportError:  # optional extra; callers run every pattern without it
+    hyperscan = None
+
+logger = get_logger(__name__)
+
+# What Python's str-pattern \s matches within ASCII; PCRE's \s lacks \x1c-\x1f
+_ASCII_SPACE = r"\t\n\x0b\x0c\r\x1c-\x1f "
+
+# Non-ASCII characters re.IGNORECASE equates with an ASCII letter that
+# str.lower() leaves alone (it already maps the Kelvin sign to "k"); the
+# dotted capital I lowers to "i" plus a combining U+0307
+_ASCII_FOLDS = (("\u0131", "i"), ("\u017f", "s"), ("\u0307", ""))
+
+
+def fold_case(text: str) -> str:
+    """Lowercase ``text`` for literal anchor checks.
+
+    Any lowercase ASCII word an ``re.IGNORECASE`` pattern matches in ``text``
+    is a substring of the result.
+    """
+    folded = text.lower()
+    if not folded.isascii():
+        for char, ascii_char in _ASCII_FOLDS:
+            if char in folded:
+                folded = folded.replace(char, ascii_char)
+    return folded
+
+
+def _to_ascii_pcre(source: str) -> str:
+    """Rewrite ``\\s`` and ``\\d`` to explicit ASCII classes for Hyperscan."""
+    out: list[str] = []
+    in_class = False
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            escape = source[i : i + 2]
+            if escape == r"\s":
+                out.append(_ASCII_SPACE if in_class else f"[{_ASCII_SPACE}]")
+            elif escape == r"\d":
+                out.append("0-9" if in_class else "[0-9]")
+            else:
+                out.append(escape)
+            i += 2
+            continue
+        if char == "[" and not in_class:
+            in_class = True
+        elif char == "]" and in_class:
+            in_class = False
+        out.append(char)
+        i += 1
+    return "".join(out)
+
+
+@functools.cache
+def _compile_database(patterns: tuple[re.Pattern[str], ...]) -> Any:
+    """Hyperscan database for a pattern set, or None without hyperscan.
+
+    Compiling takes tens of milliseconds, so it happens on first use and
+    once per pattern set, however many guard instances share the set.
+    """
+    if hyperscan is None:
+        logger.info("hyperscan_unavailable_running_all_patterns")
+        return None
+
+    flags = [
+        hyperscan.HS_FLAG_SINGLEMATCH
+        | (hyperscan.HS_FLAG_CASELESS if p.flags & re.IGNORECASE else 0)
+        for p in patterns
+    ]
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=[_to_ascii_pcre(p.pattern).encode() for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=flags,
+        )
+    except hyperscan.error as e:
+        # A pattern Hyperscan rejects is a bug in the pattern set, not a
+        # missing extra; the guards still work, only without the prefilter
+        logger.warning("hyperscan_compile_failed_running_all_patterns", error=str(e))
+        return None
+    return db
+
+
+class PatternPrefilter:
+    """Tells which of a fixed set of patterns occur in a text, in one scan."""
+
+    def __init__(self, patterns: Iterable[re.Pattern[str]]) -> None:
+        self._patterns = tuple(patterns)
+        self._local = threading.local()
+
+    def candidates(self, text: str) -> frozenset[re.Pattern[str]] | None:
+        """Patterns that match somewhere in ``text``.
+
+        Returns None when the prefilter cannot decide (no hyperscan, or
+        non-ASCII text); callers then run every pattern.
+        """
+        if not text.isascii():
+            return None
+        db = _compile_database(self._patterns)
+        if db is None:
+            return None
+
+        # Scratch space is per scan and must not be shared across threads
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(db)
+
+        hits: set[int] = set()
+
+        def on_match(
+            pattern_id: int, _start: int, _end: int, _flags: int, _context: object
+        ) -> None:
+            hits.add(pattern_id)
+
+        db.scan(text.encode("ascii"), match_event_handler=on_match, scratch=scratch)
+        return frozenset(self._patterns[i] for i in hits)
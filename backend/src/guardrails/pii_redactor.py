@@ -7,12 +7,15 @@ Falls back to regex-based detection when Presidio is unavailable.
 
 from __future__ import annotations
 
+import hashlib
 import re
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
+from src.guardrails.pattern_prefilter import PatternPrefilter, fold_case
 
 logger = get_logger(__name__)
 
@@ -69,6 +72,18 @@ PII_PATTERNS: dict[PIIEntityType, re.Pattern[str]] = {
     ),
 }
 
+# Literals every match of the pattern contains one of. Without Hyperscan, a
+# text containing none of them skips that pattern; unlisted patterns always run
+PII_ANCHORS: dict[PIIEntityType, tuple[str, ...]] = {
+    PIIEntityType.SSN: ("-",),
+    PIIEntityType.ACCOUNT_NUMBER: ("account",),
+    PIIEntityType.ROUTING_NUMBER: ("routing",),
+    PIIEntityType.EMAIL: ("@",),
+}
+
+# Marker for entities found by Presidio
+PRESIDIO_REDACTION_MARKER = "[PII_REDACTED]"
+
 # Redaction markers by entity type
 REDACTION_MARKERS: dict[PIIEntityType, str] = {
     PIIEntityType.SSN: "[SSN_REDACTED]",
@@ -83,6 +98,13 @@ REDACTION_MARKERS: dict[PIIEntityType, str] = {
 }
 
 
+# Redaction results kept for repeated texts (retries, cached LLM answers,
+# replays), keyed by digest and stored without the raw text so the cache never
+# holds PII; longer texts are not memoized so the cache stays small
+RESULT_CACHE_SIZE = 256
+MAX_CACHED_TEXT_CHARS = 64_000
+
+
 class PIIRedactor:
     """Detects and redacts PII from text using Presidio or regex fallback.
 
@@ -95,19 +117,18 @@ class PIIRedactor:
         self._enabled = settings.pii_detection_enabled
         self._use_presidio = False
         self._analyzer = None
-        self._anonymizer = None
+        self._prefilter = PatternPrefilter(PII_PATTERNS.values())
+        self._results: OrderedDict[bytes, RedactionResult] = OrderedDict()
 
         if self._enabled:
             self._try_init_presidio()
 
     def _try_init_presidio(self) -> None:
-        """Try to initialize Presidio analyzer and anonymizer."""
+        """Try to initialize the Presidio analyzer."""
         try:
             from presidio_analyzer import AnalyzerEngine
-            from presidio_anonymizer import AnonymizerEngine
 
             self._analyzer = AnalyzerEngine()
-            self._anonymizer = AnonymizerEngine()
             self._use_presidio = True
             logger.info("presidio_initialized")
         except (ImportError, Exception) as e:
@@ -117,11 +138,13 @@ class PIIRedactor:
             )
             self._use_presidio = False
 
-    def redact(self, text: str) -> RedactionResult:
+    def redact(self, text: str, cache: bool = True) -> RedactionResult:
         """Detect and redact PII from text.
 
         Args:
             text: Input text to scan for PII.
+            cache: Memoize the result. Streaming callers redact line by line
+                and pass False so one-off lines do not churn the cache.
 
         Returns:
             RedactionResult with redacted text and entity details.
@@ -133,9 +156,35 @@ class PIIRedactor:
                 was_redacted=False,
             )
 
+        cache = cache and len(text) <= MAX_CACHED_TEXT_CHARS
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest() if cache else b""
+        cached = self._results.get(key) if cache else None
+        if cached is not None:
+            self._results.move_to_end(key)
+            # Entity offsets index into the caller's text, which is the same
+            # text the cached result was computed from
+            return replace(
+                cached,
+                original_text=text,
+                entities_found=[
+                    replace(entity, text=text[entity.start:entity.end])
+                    for entity in cached.entities_found
+                ],
+            )
+
         if self._use_presidio:
-            return self._redact_with_presidio(text)
-        return self._redact_with_regex(text)
+            result = self._redact_with_presidio(text)
+        else:
+            result = self._redact_with_regex(text)
+        if cache:
+            self._results[key] = replace(
+                result,
+                original_text="",
+                entities_found=[replace(entity, text="") for entity in result.entities_found],
+            )
+            if len(self._results) > RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return result
 
     def detect_only(self, text: str) -> list[PIIEntity]:
         """Detect PII without redacting. Used for audit logging."""
@@ -148,10 +197,6 @@ class PIIRedactor:
 
     def _redact_with_presidio(self, text: str) -> RedactionResult:
         """Redact using Presidio engine with financial entity support."""
-        from presidio_analyzer import RecognizerResult
-        from presidio_anonymizer import AnonymizerEngine
-        from presidio_anonymizer.entities import OperatorConfig
-
         try:
             results = self._analyzer.analyze(
                 text=text,
@@ -172,12 +217,6 @@ class PIIRedactor:
             # Also run regex for financial-specific patterns
             regex_entities = self._detect_with_regex(text)
 
-            anonymized = self._anonymizer.anonymize(
-                text=text,
-                analyzer_results=results,
-                operators={"DEFAULT": OperatorConfig("replace", {"new_value": "[PII_REDACTED]"})},
-            )
-
             entities = [
                 PIIEntity(
                     entity_type=self._map_presidio_type(r.entity_type),
@@ -190,12 +229,10 @@ class PIIRedactor:
             ]
             entities.extend(regex_entities)
 
-            redacted_text = anonymized.text
-
-            # Apply regex-based redactions on top
-            for entity in regex_entities:
-                marker = REDACTION_MARKERS.get(entity.entity_type, "[REDACTED]")
-                redacted_text = redacted_text.replace(entity.text, marker)
+            # Presidio and regex spans are rewritten together in one pass
+            spans = [(r.start, r.end, PRESIDIO_REDACTION_MARKER) for r in results]
+            spans.extend(_redaction_span(entity) for entity in regex_entities)
+            redacted_text = _apply_redactions(text, spans)
 
             return RedactionResult(
                 original_text=text,
@@ -220,11 +257,7 @@ class PIIRedactor:
                 was_redacted=False,
             )
 
-        redacted = text
-        # Sort by position descending so replacements don't shift indices
-        for entity in sorted(entities, key=lambda e: e.start, reverse=True):
-            marker = REDACTION_MARKERS.get(entity.entity_type, "[REDACTED]")
-            redacted = redacted[:entity.start] + marker + redacted[entity.end:]
+        redacted = _apply_redactions(text, [_redaction_span(entity) for entity in entities])
 
         return RedactionResult(
             original_text=text,
@@ -237,7 +270,16 @@ class PIIRedactor:
     def _detect_with_regex(self, text: str) -> list[PIIEntity]:
         """Detect PII using regex patterns."""
         entities: list[PIIEntity] = []
+        candidates = self._prefilter.candidates(text)
+        folded = fold_case(text) if candidates is None else ""
         for entity_type, pattern in PII_PATTERNS.items():
+            if candidates is not None:
+                if pattern not in candidates:
+                    continue
+            elif entity_type in PII_ANCHORS and not any(
+                anchor in folded for anchor in PII_ANCHORS[entity_type]
+            ):
+                continue
             for match in pattern.finditer(text):
                 entities.append(
                     PIIEntity(
@@ -277,3 +319,26 @@ class PIIRedactor:
             "US_BANK_NUMBER": PIIEntityType.ACCOUNT_NUMBER,
         }
         return mapping.get(presidio_type, PIIEntityType.PERSON_NAME)
+
+
+def _redaction_span(entity: PIIEntity) -> tuple[int, int, str]:
+    return entity.start, entity.end, REDACTION_MARKERS.get(entity.entity_type, "[REDACTED]")
+
+
+def _apply_redactions(text: str, spans: list[tuple[int, int, str]]) -> str:
+    """Replace each (start, end, marker) span of ``text`` in one left-to-right pass.
+
+    Overlapping spans are merged under the marker of the one starting first
+    (the longest, on a tie), so no part of either entity survives.
+    """
+    parts: list[str] = []
+    pos = 0
+    for start, end, marker in sorted(spans, key=lambda span: (span[0], -span[1])):
+        if start < pos:
+            pos = max(pos, end)
+            continue
+        parts.append(text[pos:start])
+        parts.append(marker)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
@@ -0,0 +1,210 @@
+"""Two-tier response cache in front of the LLM.
+
+Lookups try an exact match on the full prompt first, then fall back to
+embedding similarity between the user's question and questions previously
+answered against the same context. The semantic tier only runs when an
+embedder is configured, and never reuses an answer across questions that
+mention different numbers (years, quarters, amounts). Entries expire after a
+TTL and the cache is bounded with LRU eviction.
+
+A hit costs no tokens, so it reports an empty ``TokenUsage``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+import orjson
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.models.schemas import TokenUsage
+from src.monitoring.metrics import (
+    LLM_CACHE_EXACT_HITS,
+    LLM_CACHE_MISSES,
+    LLM_CACHE_SEMANTIC_HITS,
+)
+
+logger = get_logger(__name__)
+
+# Maps text to an L2-normalized embedding vector
+Embedder = Callable[[str], np.ndarray]
+
+# Figures in a question; "FY2022" and "FY2023" embed almost identically, so
+# questions whose figures differ never share a semantic hit
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+
+
+@dataclass(slots=True)
+class CacheKey:
+    exact: str  # hash of the full request
+    scope: str  # hash of the request with the question removed
+    query: str
+    numbers: frozenset[str]
+    embedding: np.ndarray | None = None
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    scope: str
+    content: str
+    numbers: frozenset[str]
+    expires_at: float
+    embedding: np.ndarray | None
+
+
+class SemanticCache:
+    """LRU + TTL cache with exact and embedding-similarity lookup tiers."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        similarity_threshold: float = 0.92,
+        embedder: Embedder | None = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._threshold = similarity_threshold
+        self._embedder = embedder
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: list[dict[str, str]],
+        params: dict[str, Any],
+        query: str,
+        scope: list[dict[str, str]] | None = None,
+    ) -> CacheKey:
+        """Build the lookup key for a request.
+
+        ``scope`` is the prompt with the question left out. Semantic matches
+        only ever reuse answers whose scope is identical, i.e. grounded in the
+        same context. Without one the scope is the full prompt, so only the
+        exact tier can hit.
+        """
+        exact = _digest([model, params, messages])
+        return CacheKey(
+            exact=exact,
+            scope=exact if scope is None else _digest([model, params, scope]),
+            query=query,
+            numbers=frozenset(_NUMBER.findall(query)),
+        )
+
+    async def get(self, key: CacheKey) -> tuple[str, TokenUsage] | None:
+        """Return a cached response for the key, or None on a miss.
+
+        Hits report an empty ``TokenUsage``: serving them spends no tokens.
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key.exact)
+        if entry is not None and entry.expires_at > now:
+            self._entries.move_to_end(key.exact)
+            LLM_CACHE_EXACT_HITS.inc()
+            return entry.content, TokenUsage()
+
+        key.embedding = await self._embed(key.query)
+        if key.embedding is not None:
+            candidates = [
+                (k, e)
+                for k, e in self._entries.items()
+                if e.scope == key.scope
+                and e.numbers == key.numbers
+                and e.embedding is not None
+                and e.expires_at > now
+            ]
+            if candidates:
+                similarities = np.stack([e.embedding for _, e in candidates]) @ key.embedding
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self._threshold:
+                    best_key, best_entry = candidates[best]
+                    self._entries.move_to_end(best_key)
+                    LLM_CACHE_SEMANTIC_HITS.inc()
+                    return best_entry.content, TokenUsage()
+
+        LLM_CACHE_MISSES.inc()
+        return None
+
+    async def put(self, key: CacheKey, content: str) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        if key.embedding is None:
+            key.embedding = await self._embed(key.query)
+
+        self._entries[key.exact] = _CacheEntry(
+            scope=key.scope,
+            content=content,
+            numbers=key.numbers,
+            expires_at=time.monotonic() + self._ttl_seconds,
+            embedding=key.embedding,
+        )
+        self._entries.move_to_end(key.exact)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def warm_up(self) -> None:
+        """Load the embedding model now rather than on the first cache miss."""
+        await self._embed("")
+
+    async def _embed(self, text: str) -> np.ndarray | None:
+        if self._embedder is None:
+            return None
+        try:
+            return await asyncio.to_thread(self._embedder, text)
+        except Exception as e:
+            # Degrade to exact-match only rather than failing generation
+            logger.warning("llm_cache_embedder_disabled", error=str(e))
+            self._embedder = None
+            return None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _digest(payload: Any) -> str:
+    return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _local_embedder(model_name: str) -> Embedder:
+    """Lazily load a small sentence-transformers model on first use."""
+    model = None
+    # Concurrent first calls run on different threads; only one loads
+    load_lock = threading.Lock()
+
+    def embed(text: str) -> np.ndarray:
+        nonlocal model
+        if model is None:
+            with load_lock:
+                if model is None:
+                    # Imported here, not at module load: it pulls in torch
+                    st = importlib.import_module("sentence_transformers")
+                    model = st.SentenceTransformer(model_name)
+        return model.encode(text, normalize_embeddings=True)
+
+    return embed
+
+
+@lru_cache(maxsize=1)
+def get_llm_cache() -> SemanticCache:
+    settings = get_settings()
+    return SemanticCache(
+        max_entries=settings.llm_cache_max_entries,
+        ttl_seconds=settings.llm_cache_ttl_seconds,
+        similarity_threshold=settings.llm_cache_similarity_threshold,
+        embedder=(
+            _local_embedder(settings.llm_cache_embedding_model)
+            if settings.llm_cache_semantic_enabled
+            else None
+        ),
+    )
@@ -9,20 +9,30 @@ Provides a unified interface for LLM inference with:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import time
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 from typing import Any
 
-from openai import AsyncOpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+import httpx
+import openai
+import orjson
+from openai import AsyncOpenAI, DefaultAioHttpClient
+from openai.types.chat import ChatCompletion
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from src.core.config import get_settings
 from src.core.exceptions import LLMError
 from src.core.logging import get_logger
+from src.llm.cache import get_llm_cache
 from src.models.schemas import TokenUsage
 from src.monitoring.metrics import (
+    LLM_COALESCED_REQUESTS,
+    LLM_COMPLETION_TOKENS,
+    LLM_PROMPT_TOKENS,
     LLM_REQUEST_LATENCY,
-    LLM_TOKEN_USAGE,
     LLM_REQUEST_ERRORS,
 )
 
@@ -34,6 +44,73 @@ PRICING = {
     "gpt-4o": {"input": 0.005, "output": 0.015},
     "gpt-3.5-turbo": {"input": 0.0005, "output": 0.0015},
 }
+DEFAULT_PRICING_MODEL = "gpt-4-turbo-preview"
+
+# (input, output) USD per single token, derived once from PRICING
+_PRICE_PER_TOKEN: dict[str, tuple[float, float]] = {
+    model: (prices["input"] / 1000, prices["output"] / 1000) for model, prices in PRICING.items()
+}
+
+# Connection pool for the shared aiohttp transport
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=60,
+)
+
+# Transient failures worth retrying; 4xx errors such as bad requests,
+# auth failures, and context-length overflows fail immediately
+RETRYABLE_ERRORS = (
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+# Budget for the startup connection warm-up; failures there are non-fatal
+WARM_UP_TIMEOUT_S = 5.0
+
+# Upper bound on in-flight requests fanned out by generate_many
+LLM_MAX_CONCURRENCY = 50
+
+# generate_stream coalesces deltas until either bound is reached
+STREAM_FLUSH_CHARS = 64
+STREAM_FLUSH_INTERVAL_S = 0.02
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> AsyncOpenAI:
+    """Process-wide OpenAI client shared by the LLM and embedding services.
+
+    Every caller reuses one aiohttp-backed connection pool, which is opened
+    lazily on the first request.
+    """
+    settings = get_settings()
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key.get_secret_value(),
+        http_client=DefaultAioHttpClient(limits=HTTP_POOL_LIMITS),
+    )
+
+
+async def close_openai_client() -> None:
+    """Close the shared OpenAI client and its connection pool if one was created."""
+    if get_openai_client.cache_info().currsize:
+        await get_openai_client().close()
+        get_openai_client.cache_clear()
+
+
+def _request_key(
+    model: str,
+    messages: list[dict[str, str]],
+    temperature: float,
+    max_tokens: int,
+    response_format: dict[str, str] | None,
+) -> bytes:
+    payload = orjson.dumps(
+        [model, messages, temperature, max_tokens, response_format],
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.blake2b(payload, digest_size=16).digest()
 
 
 class LLMClient:
@@ -41,38 +118,106 @@ class LLMClient:
 
     def __init__(self) -> None:
         settings = get_settings()
-        self._client = AsyncOpenAI(api_key=settings.openai_api_key.get_secret_value())
+        self._client = get_openai_client()
         self._model = settings.openai_model
         self._max_tokens = settings.max_token_output
+        self._price_in, self._price_out = _PRICE_PER_TOKEN.get(
+            self._model, _PRICE_PER_TOKEN[DEFAULT_PRICING_MODEL]
+        )
+        self._cache = get_llm_cache() if settings.llm_cache_enabled else None
+        self._concurrency = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+        self._inflight: dict[bytes, asyncio.Task[tuple[str, TokenUsage]]] = {}
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=15),
-        reraise=True,
-    )
     async def generate(
         self,
         messages: list[dict[str, str]],
         temperature: float = 0.1,
         max_tokens: int | None = None,
         response_format: dict[str, str] | None = None,
+        cache_query: str | None = None,
+        cache_scope: list[dict[str, str]] | None = None,
+        refresh_cache: bool = False,
     ) -> tuple[str, TokenUsage]:
         """Generate a completion from the LLM.
 
+        Cacheable requests (``cache_query`` set, no refresh) that are identical
+        to one already in flight await that request's result instead of
+        issuing their own call.
+
         Args:
             messages: Chat messages in OpenAI format.
             temperature: Sampling temperature (lower = more deterministic).
             max_tokens: Max output tokens (defaults to config).
             response_format: Optional structured output format.
+            cache_query: The user's question. When set, the response may be
+                served from and is written to the prompt cache.
+            cache_scope: ``messages`` built without the question. Cached
+                answers to similar questions are reused only when their
+                scope matches.
+            refresh_cache: Skip the cache lookup but still store the result.
 
         Returns:
             Tuple of (response_text, token_usage).
 
         Raises:
-            LLMError: If the API call fails after retries.
+            LLMError: If the API call fails permanently or after retries.
         """
-        start = time.perf_counter()
         max_tokens = max_tokens or self._max_tokens
+        if cache_query is None or refresh_cache:
+            return await self._generate(
+                messages,
+                temperature,
+                max_tokens,
+                response_format,
+                cache_query,
+                cache_scope,
+                refresh_cache,
+            )
+
+        # Identical concurrent requests share one lookup and one upstream call.
+        # The shared task is shielded so a cancelled caller does not cancel it
+        # for the others.
+        key = _request_key(self._model, messages, temperature, max_tokens, response_format)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._generate(
+                    messages, temperature, max_tokens, response_format, cache_query, cache_scope
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            LLM_COALESCED_REQUESTS.inc()
+        return await asyncio.shield(task)
+
+    async def _generate(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        response_format: dict[str, str] | None,
+        cache_query: str | None = None,
+        cache_scope: list[dict[str, str]] | None = None,
+        refresh_cache: bool = False,
+    ) -> tuple[str, TokenUsage]:
+        cache_key = None
+        if cache_query is not None and self._cache is not None:
+            cache_key = self._cache.make_key(
+                self._model,
+                messages,
+                {
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                    "response_format": response_format,
+                },
+                cache_query,
+                cache_scope,
+            )
+            if not refresh_cache:
+                cached = await self._cache.get(cache_key)
+                if cached is not None:
+                    return cached
 
         try:
             kwargs: dict[str, Any] = {
@@ -84,32 +229,81 @@ class LLMClient:
             if response_format:
                 kwargs["response_format"] = response_format
 
-            response = await self._client.chat.completions.create(**kwargs)
-            elapsed_ms = (time.perf_counter() - start) * 1000
+            start_ns = time.perf_counter_ns()
+            response = await self._create_completion(**kwargs)
+            elapsed_ns = time.perf_counter_ns() - start_ns
 
             # Track metrics
-            LLM_REQUEST_LATENCY.observe(elapsed_ms / 1000)
+            LLM_REQUEST_LATENCY.observe(elapsed_ns * 1e-9)
 
-            content = response.choices[0].message.content or ""
+            message = response.choices[0].message
+            content = message.content or ""
             usage = self._extract_usage(response)
+            prompt_tokens = usage.prompt_tokens
+            completion_tokens = usage.completion_tokens
 
-            LLM_TOKEN_USAGE.labels(type="prompt").inc(usage.prompt_tokens)
-            LLM_TOKEN_USAGE.labels(type="completion").inc(usage.completion_tokens)
+            LLM_PROMPT_TOKENS.inc(prompt_tokens)
+            LLM_COMPLETION_TOKENS.inc(completion_tokens)
 
             logger.info(
                 "llm_generation_complete",
                 model=self._model,
-                latency_ms=round(elapsed_ms, 2),
-                prompt_tokens=usage.prompt_tokens,
-                completion_tokens=usage.completion_tokens,
+                latency_ms=elapsed_ns * 1e-6,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
             )
 
-            return content, usage
-
         except Exception as e:
             LLM_REQUEST_ERRORS.inc()
             raise LLMError(f"LLM generation failed: {e}") from e
 
+        if cache_key is not None:
+            await self._cache.put(cache_key, content)
+        return content, usage
+
+    @retry(
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=15),
+        reraise=True,
+    )
+    async def _create_completion(self, **kwargs: Any) -> ChatCompletion:
+        # Pre-encode the body with orjson; the SDK sends bytes bodies as-is
+        # instead of running its stdlib json encoder over the full context
+        return await self._client.post(
+            "/chat/completions",
+            body=orjson.dumps(kwargs),
+            cast_to=ChatCompletion,
+        )
+
+    async def generate_many(
+        self,
+        batches: list[list[dict[str, str]]],
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> list[tuple[str, TokenUsage] | BaseException]:
+        """Run independent generations concurrently.
+
+        Latency is that of the slowest call rather than the sum of all of
+        them. In-flight requests are capped at ``LLM_MAX_CONCURRENCY``.
+
+        Args:
+            batches: One message list per generation.
+            return_exceptions: Return failures in place instead of raising.
+            **kwargs: Passed through to ``generate``.
+
+        Returns:
+            Results in the same order as ``batches``.
+        """
+
+        async def bounded(messages: list[dict[str, str]]) -> tuple[str, TokenUsage]:
+            async with self._concurrency:
+                return await self.generate(messages, **kwargs)
+
+        return await asyncio.gather(
+            *(bounded(m) for m in batches), return_exceptions=return_exceptions
+        )
+
     async def generate_stream(
         self,
         messages: list[dict[str, str]],
@@ -118,7 +312,9 @@ class LLMClient:
     ) -> AsyncGenerator[str, None]:
         """Stream LLM response tokens.
 
-        Yields individual text chunks as they arrive from the API.
+        Deltas are coalesced and yielded once ``STREAM_FLUSH_CHARS`` have
+        accumulated or ``STREAM_FLUSH_INTERVAL_S`` has passed since the last
+        yield, cutting the number of downstream writes per response.
         """
         max_tokens = max_tokens or self._max_tokens
 
@@ -131,14 +327,45 @@ class LLMClient:
                 stream=True,
             )
 
+            monotonic = time.monotonic
+            buf: list[str] = []
+            buf_len = 0
+            last_flush = monotonic()
+
             async for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+                choices = chunk.choices
+                if not choices:
+                    continue
+                content = choices[0].delta.content
+                if not content:
+                    continue
+
+                buf.append(content)
+                buf_len += len(content)
+                now = monotonic()
+                if buf_len >= STREAM_FLUSH_CHARS or now - last_flush >= STREAM_FLUSH_INTERVAL_S:
+                    yield "".join(buf)
+                    buf.clear()
+                    buf_len = 0
+                    last_flush = now
+
+            if buf:
+                yield "".join(buf)
 
         except Exception as e:
             LLM_REQUEST_ERRORS.inc()
             raise LLMError(f"LLM streaming failed: {e}") from e
 
+    async def warm_up(self) -> None:
+        """Open a pooled connection to the API before the first real request."""
+        try:
+            await asyncio.wait_for(
+                self._client.with_options(max_retries=0).models.list(),
+                timeout=WARM_UP_TIMEOUT_S,
+            )
+        except Exception as e:
+            logger.warning("llm_warm_up_failed", error=str(e))
+
     def _extract_usage(self, response: Any) -> TokenUsage:
         """Extract token usage and estimate cost."""
         usage = response.usage
@@ -150,11 +377,7 @@ class LLMClient:
         total_tokens = usage.total_tokens
 
         # Estimate cost
-        pricing = PRICING.get(self._model, PRICING["gpt-4-turbo-preview"])
-        cost = (
-            (prompt_tokens / 1000) * pricing["input"]
-            + (completion_tokens / 1000) * pricing["output"]
-        )
+        cost = prompt_tokens * self._price_in + completion_tokens * self._price_out
 
         return TokenUsage(
             prompt_tokens=prompt_tokens,
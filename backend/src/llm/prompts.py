@@ -9,8 +9,50 @@ Each prompt is designed for a specific query type and enforces:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from string import Template
+
 from src.models.schemas import QueryType
 
+
+class _PresplitTemplate(Template):
+    """A ``string.Template`` whose placeholders are located once, up front.
+
+    ``substitute`` joins the pre-split literal segments with the given values
+    instead of re-running the placeholder regex over the template per call.
+    """
+
+    def __init__(self, template: str) -> None:
+        super().__init__(template)
+        literals: list[str] = []
+        names: list[str] = []
+        literal_start = 0
+        pending = ""
+        for match in self.pattern.finditer(template):
+            pending += template[literal_start : match.start()]
+            literal_start = match.end()
+            if match.group("escaped") is not None:
+                pending += self.delimiter
+                continue
+            name = match.group("named") or match.group("braced")
+            if name is None:
+                raise ValueError(f"Invalid placeholder in prompt template: {match.group()!r}")
+            literals.append(pending)
+            names.append(name)
+            pending = ""
+        literals.append(pending + template[literal_start:])
+        self._literals = tuple(literals)
+        self._names = tuple(names)
+
+    def substitute(self, mapping: Mapping[str, object] | None = None, /, **kws: object) -> str:
+        values = {**mapping, **kws} if mapping else kws
+        parts = [self._literals[0]]
+        for name, literal in zip(self._names, self._literals[1:], strict=True):
+            parts.append(str(values[name]))
+            parts.append(literal)
+        return "".join(parts)
+
+
 SYSTEM_PROMPT = """You are a senior financial analyst AI assistant with expertise in SEC filings,
 earnings reports, and investment analysis. You provide accurate, well-sourced financial insights.
 
@@ -25,6 +67,22 @@ CRITICAL RULES:
 7. NEVER provide investment advice or recommendations."""
 
 
+# Per-request user message; only these three fields vary
+_USER_TEMPLATE = """## QUERY TYPE
+{qt}
+
+## SOURCE DOCUMENTS
+{ctx}
+
+## USER QUESTION
+{q}
+
+Begin your response:"""
+
+# Citation markers for every rank a query can retrieve (QueryRequest.top_k <= 20)
+_SOURCE_HEADERS: tuple[str, ...] = tuple(f"[Source {i}]\n" for i in range(1, 21))
+
+
 def build_rag_prompt(
     query: str,
     context_chunks: list[str],
@@ -32,6 +90,11 @@ def build_rag_prompt(
 ) -> list[dict[str, str]]:
     """Build the full prompt with context injection and query-type-specific instructions.
 
+    Everything that does not vary per request (rules, instructions for every
+    query type, response format) lives in a byte-identical system message,
+    so the provider can reuse its cached prefix across calls. Only the query
+    type, sources, and question go into the user message.
+
     Args:
         query: User's question.
         context_chunks: Retrieved document chunks to use as context.
@@ -43,33 +106,12 @@ def build_rag_prompt(
     # Format context with numbered sources for citation
     formatted_context = _format_context(context_chunks)
 
-    # Get query-type-specific instructions
-    type_instructions = QUERY_TYPE_INSTRUCTIONS.get(query_type, "")
-
-    user_prompt = f"""## SOURCE DOCUMENTS
-{formatted_context}
-
-## QUERY TYPE
-{query_type.value}
-
-## SPECIFIC INSTRUCTIONS
-{type_instructions}
-
-## USER QUESTION
-{query}
-
-## RESPONSE FORMAT
-Provide a structured response with:
-1. **Summary**: A concise answer (2-3 sentences)
-2. **Detailed Analysis**: Thorough analysis with [Source N] citations for every factual claim
-3. **Key Figures**: Any relevant numerical data from the sources
-4. **Confidence Assessment**: Your confidence level (HIGH/MEDIUM/LOW) with reasoning
-5. **Caveats**: Any limitations or missing information
-
-Begin your response:"""
+    user_prompt = _USER_TEMPLATE.format_map(
+        {"qt": query_type.value, "ctx": formatted_context, "q": query}
+    )
 
     return [
-        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "system", "content": RAG_SYSTEM_PROMPT},
         {"role": "user", "content": user_prompt},
     ]
 
@@ -79,11 +121,15 @@ def _format_context(chunks: list[str]) -> str:
     if not chunks:
         return "[No source documents available]"
 
-    formatted_parts: list[str] = []
-    for i, chunk in enumerate(chunks, 1):
-        formatted_parts.append(f"[Source {i}]\n{chunk}\n")
+    if len(chunks) > len(_SOURCE_HEADERS):
+        return "\n---\n".join([f"[Source {i}]\n{chunk}\n" for i, chunk in enumerate(chunks, 1)])
 
-    return "\n---\n".join(formatted_parts)
+    # str.join sizes its output from a list in one pass; a generator would
+    # be materialized into a list internally anyway. There are more headers
+    # than chunks, so the zip stops at the last chunk
+    return "\n---\n".join(
+        [header + chunk + "\n" for header, chunk in zip(_SOURCE_HEADERS, chunks, strict=False)]
+    )
 
 
 # Query-type-specific prompt additions
@@ -131,19 +177,42 @@ IMPORTANT: Do NOT provide investment advice. Present facts only.""",
 Cite all factual claims. Express confidence level based on source coverage.""",
 }
 
+RESPONSE_FORMAT = """Provide a structured response with:
+1. **Summary**: A concise answer (2-3 sentences)
+2. **Detailed Analysis**: Thorough analysis with [Source N] citations for every factual claim
+3. **Key Figures**: Any relevant numerical data from the sources
+4. **Confidence Assessment**: Your confidence level (HIGH/MEDIUM/LOW) with reasoning
+5. **Caveats**: Any limitations or missing information"""
+
+# Static system message shared by every RAG request (stable prompt-cache prefix)
+RAG_SYSTEM_PROMPT = "\n\n".join(
+    [
+        SYSTEM_PROMPT,
+        "## QUERY TYPES\n"
+        "Each request names its query type. Follow the instructions for that type.",
+        *(
+            f"### {qt.value}\n{instructions}"
+            for qt, instructions in QUERY_TYPE_INSTRUCTIONS.items()
+        ),
+        f"## RESPONSE FORMAT\n{RESPONSE_FORMAT}",
+    ]
+)
 
-# Evaluation prompt for hallucination detection (used by evaluation layer)
-HALLUCINATION_CHECK_PROMPT = """You are an expert fact-checker for financial documents.
+
+# Evaluation prompt for hallucination detection (used by evaluation layer).
+# Evaluation prompts are string.Templates so their JSON examples need no brace escaping.
+HALLUCINATION_CHECK_PROMPT = _PresplitTemplate(
+    """You are an expert fact-checker for financial documents.
 Your task is to evaluate whether a generated response is factually grounded in the provided source documents.
 
 ## SOURCE DOCUMENTS
-{context}
+$context
 
 ## GENERATED RESPONSE
-{response}
+$response
 
 ## ORIGINAL QUESTION
-{query}
+$query
 
 ## EVALUATION CRITERIA
 For each factual claim in the response, determine:
@@ -152,36 +221,41 @@ For each factual claim in the response, determine:
 3. CONTRADICTED: The claim contradicts information in the sources
 
 ## OUTPUT FORMAT (JSON)
-{{
+{
     "claims": [
-        {{"claim": "...", "verdict": "SUPPORTED|UNSUPPORTED|CONTRADICTED", "evidence": "...", "source_ref": "Source N"}}
+        {"claim": "...", "verdict": "SUPPORTED|UNSUPPORTED|CONTRADICTED",
+         "evidence": "...", "source_ref": "Source N"}
     ],
     "hallucination_score": 0.0-1.0,
     "factual_grounding_score": 0.0-1.0,
     "reasoning": "..."
-}}
+}
 
 Evaluate now:"""
+)
 
 
-CONSISTENCY_CHECK_PROMPT = """Compare these two responses to the same financial query and evaluate their semantic consistency.
+CONSISTENCY_CHECK_PROMPT = _PresplitTemplate(
+    """\
+Compare these two responses to the same financial query and evaluate their semantic consistency.
 
 ## QUERY
-{query}
+$query
 
 ## RESPONSE A
-{response_a}
+$response_a
 
 ## RESPONSE B
-{response_b}
+$response_b
 
 ## EVALUATION
 Rate the semantic consistency from 0.0 (completely different) to 1.0 (identical meaning).
 Focus on: numerical agreement, directional agreement (up/down/stable), qualitative consistency.
 
 Output JSON:
-{{
+{
     "consistency_score": 0.0-1.0,
     "discrepancies": ["..."],
     "reasoning": "..."
-}}"""
+}"""
+)
@@ -1,6 +1,7 @@
 """FastAPI application entry point.
 
 Configures:
+- Kubernetes probe interception (pure ASGI, ahead of FastAPI)
 - CORS middleware
 - Prometheus metrics instrumentation
 - API route registration
@@ -16,15 +17,25 @@ from collections.abc import AsyncGenerator
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from prometheus_fastapi_instrumentator import Instrumentator
+from prometheus_fastapi_instrumentator import Instrumentator, metrics
 
+from src.api.dependencies import get_llm_client
+from src.api.health_interceptor import HealthCheckInterceptor
+from src.api.ingest_jobs import close_ingest_job_store
 from src.api.routes import documents, evaluation, health, query
 from src.core.config import get_settings
 from src.core.exceptions import FinancialInsightsError
-from src.core.logging import get_logger, setup_logging
+from src.core.logging import get_logger, setup_logging, shutdown_logging
+from src.document_processing.chunker import get_encoder, shutdown_process_pool
+from src.llm.cache import get_llm_cache
+from src.llm.client import close_openai_client
 
 logger = get_logger(__name__)
 
+# Request latency buckets; the instrumentator default has 21, and every one
+# is serialized on each /metrics scrape
+HTTP_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -36,8 +47,32 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         environment=settings.app_env.value,
         version=settings.app_version,
     )
+
+    # Build the service singletons and load the tokenizer and the prompt
+    # cache's embedding model now, so the first request does not pay for
+    # them. Each step is best-effort: whatever fails here loads lazily on
+    # first use instead of keeping the app (and its probes) from starting.
+    try:
+        get_encoder()
+    except Exception as e:
+        logger.warning("tokenizer_warm_up_failed", error=str(e))
+    try:
+        if settings.llm_cache_enabled:
+            await get_llm_cache().warm_up()
+    except Exception as e:
+        logger.warning("llm_cache_warm_up_failed", error=str(e))
+    try:
+        await get_llm_client().warm_up()
+    except Exception as e:
+        logger.warning("llm_client_warm_up_failed", error=str(e))
+    logger.info("application_warmed_up")
+
     yield
     logger.info("application_shutting_down")
+    await close_openai_client()
+    await close_ingest_job_store()
+    shutdown_process_pool()
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
@@ -71,7 +106,14 @@ def create_app() -> FastAPI:
         Instrumentator(
             should_group_status_codes=True,
             should_ignore_untemplated=True,
+            should_exclude_streaming_duration=True,
+            inprogress_labels=False,
             excluded_handlers=["/health", "/ready", "/live", "/metrics"],
+        ).add(
+            metrics.default(
+                latency_highr_buckets=HTTP_LATENCY_BUCKETS,
+                should_exclude_streaming_duration=True,
+            )
         ).instrument(app).expose(app, endpoint="/metrics")
 
     # Register routes
@@ -102,7 +144,10 @@ def create_app() -> FastAPI:
     return app
 
 
-app = create_app()
+fastapi_app = create_app()
+
+# /ready and /live are answered here without entering the FastAPI stack
+app = HealthCheckInterceptor(fastapi_app)
 
 if __name__ == "__main__":
     import uvicorn
@@ -4,97 +4,108 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import Any, ClassVar
 
-from sqlalchemy import (
-    Column,
-    DateTime,
-    Float,
-    Integer,
-    String,
-    Text,
-    Boolean,
-)
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import DateTime, Float, Index, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
 class Base(DeclarativeBase):
-    pass
+    type_annotation_map: ClassVar[dict[Any, Any]] = {
+        uuid.UUID: UUID(as_uuid=True),
+        datetime: DateTime,
+        float: Float,
+        dict[str, Any]: JSONB,
+        list[str]: JSONB,
+    }
 
 
 class QueryLog(Base):
     """Stores every query and response for audit and analytics."""
 
     __tablename__ = "query_logs"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    query_text = Column(Text, nullable=False)
-    query_type = Column(String(50), nullable=False)
-    response_text = Column(Text, nullable=False)
-    model_used = Column(String(100), nullable=False)
-    company_filter = Column(String(20), nullable=True)
+    __table_args__ = (
+        # Time-windowed dashboards by verdict, and per-model usage over time
+        Index("ix_query_logs_created_at_evaluation_status", "created_at", "evaluation_status"),
+        Index("ix_query_logs_model_used_created_at", "model_used", "created_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    query_text: Mapped[str] = mapped_column(Text)
+    query_type: Mapped[str] = mapped_column(String(50))
+    response_text: Mapped[str] = mapped_column(Text)
+    model_used: Mapped[str] = mapped_column(String(100))
+    company_filter: Mapped[str | None] = mapped_column(String(20))
 
     # Token usage
-    prompt_tokens = Column(Integer, default=0)
-    completion_tokens = Column(Integer, default=0)
-    total_tokens = Column(Integer, default=0)
-    estimated_cost_usd = Column(Float, default=0.0)
+    prompt_tokens: Mapped[int | None] = mapped_column(default=0)
+    completion_tokens: Mapped[int | None] = mapped_column(default=0)
+    total_tokens: Mapped[int | None] = mapped_column(default=0)
+    estimated_cost_usd: Mapped[float | None] = mapped_column(default=0.0)
 
     # Evaluation scores
-    hallucination_score = Column(Float, nullable=True)
-    confidence_score = Column(Float, nullable=True)
-    consistency_score = Column(Float, nullable=True)
-    factual_grounding_score = Column(Float, nullable=True)
-    evaluation_status = Column(String(20), nullable=True)
+    hallucination_score: Mapped[float | None]
+    confidence_score: Mapped[float | None]
+    consistency_score: Mapped[float | None]
+    factual_grounding_score: Mapped[float | None]
+    evaluation_status: Mapped[str | None] = mapped_column(String(20))
 
     # Metadata
-    latency_ms = Column(Float, default=0.0)
-    citations_count = Column(Integer, default=0)
-    citations_json = Column(JSONB, nullable=True)
-    pii_detected = Column(Boolean, default=False)
-    pii_entities_redacted = Column(JSONB, nullable=True)
+    latency_ms: Mapped[float | None] = mapped_column(default=0.0)
+    citations_count: Mapped[int | None] = mapped_column(default=0)
+    citations_json: Mapped[dict[str, Any] | None]
+    pii_detected: Mapped[bool | None] = mapped_column(default=False)
+    pii_entities_redacted: Mapped[list[str] | None]
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
 
 
 class DocumentRecord(Base):
     """Tracks ingested documents and their processing status."""
 
     __tablename__ = "document_records"
+    __table_args__ = (
+        # Also serves ticker-only lookups through its leading column
+        Index("ix_document_records_ticker_filing_type", "ticker", "filing_type"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    company_name = Column(String(200), nullable=False)
-    ticker = Column(String(10), nullable=False, index=True)
-    filing_type = Column(String(50), nullable=False)
-    filing_date = Column(String(20), nullable=True)
-    source_url = Column(Text, nullable=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    company_name: Mapped[str] = mapped_column(String(200))
+    ticker: Mapped[str] = mapped_column(String(10))
+    filing_type: Mapped[str] = mapped_column(String(50))
+    filing_date: Mapped[str | None] = mapped_column(String(20))
+    source_url: Mapped[str | None] = mapped_column(Text)
 
-    chunks_count = Column(Integer, default=0)
-    total_tokens = Column(Integer, default=0)
-    processing_time_ms = Column(Float, default=0.0)
-    status = Column(String(20), default="processed")
-    error_message = Column(Text, nullable=True)
+    chunks_count: Mapped[int | None] = mapped_column(default=0)
+    total_tokens: Mapped[int | None] = mapped_column(default=0)
+    processing_time_ms: Mapped[float | None] = mapped_column(default=0.0)
+    status: Mapped[str | None] = mapped_column(String(20), default="processed")
+    error_message: Mapped[str | None] = mapped_column(Text)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
 
 
 class EvaluationLog(Base):
     """Stores evaluation results for trend analysis and monitoring."""
 
     __tablename__ = "evaluation_logs"
+    __table_args__ = (
+        Index("ix_evaluation_logs_created_at_status", "created_at", "status"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    query_log_id = Column(UUID(as_uuid=True), nullable=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    query_log_id: Mapped[uuid.UUID | None]
 
-    hallucination_score = Column(Float, nullable=False)
-    factual_grounding_score = Column(Float, nullable=False)
-    semantic_consistency_score = Column(Float, nullable=False)
-    confidence_score = Column(Float, nullable=False)
-    status = Column(String(20), nullable=False)
-    flags = Column(JSONB, nullable=True)
-    reasoning = Column(Text, nullable=True)
+    hallucination_score: Mapped[float]
+    factual_grounding_score: Mapped[float]
+    semantic_consistency_score: Mapped[float]
+    confidence_score: Mapped[float]
+    status: Mapped[str] = mapped_column(String(20))
+    flags: Mapped[list[str] | None]
+    reasoning: Mapped[str | None] = mapped_column(Text)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
 
 
 class GuardrailEvent(Base):
@@ -102,9 +113,9 @@ class GuardrailEvent(Base):
 
     __tablename__ = "guardrail_events"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    event_type = Column(String(50), nullable=False)  # pii_detection, content_filter, etc.
-    query_log_id = Column(UUID(as_uuid=True), nullable=True)
-    details = Column(JSONB, nullable=True)
-    action_taken = Column(String(50), nullable=False)  # redacted, blocked, flagged
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    event_type: Mapped[str] = mapped_column(String(50))  # pii_detection, content_filter, etc.
+    query_log_id: Mapped[uuid.UUID | None]
+    details: Mapped[dict[str, Any] | None]
+    action_taken: Mapped[str] = mapped_column(String(50))  # redacted, blocked, flagged
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
@@ -104,6 +104,14 @@ class EvaluationResult(BaseModel):
     evaluation_reasoning: str = ""
 
 
+class TokenUsage(BaseModel):
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    embedding_tokens: int = 0
+    estimated_cost_usd: float = 0.0
+
+
 class QueryResponse(BaseModel):
     query_id: str = Field(default_factory=lambda: str(uuid4()))
     query: str
@@ -117,18 +125,6 @@ class QueryResponse(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
-class TokenUsage(BaseModel):
-    prompt_tokens: int = 0
-    completion_tokens: int = 0
-    total_tokens: int = 0
-    embedding_tokens: int = 0
-    estimated_cost_usd: float = 0.0
-
-
-# Fix forward reference
-QueryResponse.model_rebuild()
-
-
 # === Evaluation API Models ===
 
 class EvaluationRequest(BaseModel):
@@ -154,21 +150,17 @@ class EvaluationMetrics(BaseModel):
 
 # === Health & Monitoring ===
 
-class HealthStatus(BaseModel):
-    status: str = "healthy"
-    version: str
-    environment: str
-    components: dict[str, ComponentHealth] | None = None
-
-
 class ComponentHealth(BaseModel):
     status: str
     latency_ms: float = 0.0
     details: str = ""
 
 
-# Fix forward reference
-HealthStatus.model_rebuild()
+class HealthStatus(BaseModel):
+    status: str = "healthy"
+    version: str
+    environment: str
+    components: dict[str, ComponentHealth] | None = None
 
 
 # === SEC Filing Models ===
@@ -177,6 +169,7 @@ class SECFilingRequest(BaseModel):
     ticker: str = Field(..., min_length=1, max_length=10)
     filing_type: FilingType
     num_filings: int = Field(default=1, ge=1, le=10)
+    bulk: bool = False  # Load through the vector store's bulk path
 
 
 class SECFilingResponse(BaseModel):
@@ -185,3 +178,22 @@ class SECFilingResponse(BaseModel):
     documents_processed: int
     total_chunks: int
     processing_time_ms: float
+
+
+class IngestJobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class IngestJob(BaseModel):
+    job_id: str
+    status: IngestJobStatus = IngestJobStatus.PENDING
+    ticker: str
+    filing_type: FilingType
+    # Set when a worker picks the job up; a job left running long past this
+    # lost its worker
+    started_at: datetime | None = None
+    result: SECFilingResponse | None = None
+    error: str | None = None
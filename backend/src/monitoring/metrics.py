@@ -10,7 +10,22 @@ Defines domain-specific metrics for tracking:
 
 from __future__ import annotations
 
+from functools import cache
+
 from prometheus_client import Counter, Gauge, Histogram, Summary
+from prometheus_client.metrics import MetricWrapperBase
+
+
+@cache
+def labeled(metric: MetricWrapperBase, **labels: str) -> MetricWrapperBase:
+    """Return the child metric for a label set, resolving it only once.
+
+    ``metric.labels(...)`` validates and hashes the label values under a lock
+    on every call; label sets here come from small enums, so caching the
+    children is bounded.
+    """
+    return metric.labels(**labels)
+
 
 # === LLM Metrics ===
 
@@ -26,6 +41,9 @@ LLM_TOKEN_USAGE = Counter(
     ["type"],  # prompt, completion
 )
 
+LLM_PROMPT_TOKENS = LLM_TOKEN_USAGE.labels(type="prompt")
+LLM_COMPLETION_TOKENS = LLM_TOKEN_USAGE.labels(type="completion")
+
 LLM_REQUEST_ERRORS = Counter(
     "llm_request_errors_total",
     "Total LLM API request errors",
@@ -36,6 +54,25 @@ LLM_COST_USD = Counter(
     "Estimated cumulative LLM API cost in USD",
 )
 
+LLM_CACHE_HITS = Counter(
+    "llm_cache_hits_total",
+    "LLM responses served from the prompt cache",
+    ["tier"],  # exact, semantic
+)
+
+LLM_CACHE_EXACT_HITS = LLM_CACHE_HITS.labels(tier="exact")
+LLM_CACHE_SEMANTIC_HITS = LLM_CACHE_HITS.labels(tier="semantic")
+
+LLM_CACHE_MISSES = Counter(
+    "llm_cache_misses_total",
+    "Cacheable LLM requests that missed the prompt cache",
+)
+
+LLM_COALESCED_REQUESTS = Counter(
+    "llm_coalesced_requests_total",
+    "LLM requests that joined an identical in-flight request",
+)
+
 # === Embedding Metrics ===
 
 EMBEDDING_LATENCY = Summary(
@@ -77,6 +114,10 @@ EVALUATION_SCORES = Histogram(
     buckets=[0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
 )
 
+HALLUCINATION_SCORE = EVALUATION_SCORES.labels(metric="hallucination")
+CONSISTENCY_SCORE = EVALUATION_SCORES.labels(metric="consistency")
+CONFIDENCE_SCORE = EVALUATION_SCORES.labels(metric="confidence")
+
 EVALUATION_STATUS_COUNTER = Counter(
     "evaluation_status_total",
     "Count of evaluation verdicts",
@@ -17,6 +17,7 @@ The graph supports conditional edges for:
 from __future__ import annotations
 
 import time
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -25,7 +26,7 @@ from langgraph.graph import END, StateGraph
 from src.core.config import get_settings
 from src.core.logging import get_logger
 from src.evaluation.evaluator import EvaluationPipeline
-from src.guardrails.content_filter import ContentFilter
+from src.guardrails.content_filter import FLS_DISCLAIMER, ContentFilter, ViolationType
 from src.guardrails.pii_redactor import PIIRedactor
 from src.llm.client import LLMClient
 from src.llm.prompts import build_rag_prompt
@@ -44,6 +45,7 @@ from src.monitoring.metrics import (
     PII_DETECTIONS,
     PII_REDACTIONS,
     CONTENT_FILTER_VIOLATIONS,
+    labeled,
 )
 from src.rag.embeddings import EmbeddingService
 from src.rag.retriever import HybridRetriever
@@ -154,26 +156,16 @@ class QueryOrchestrator:
             QueryResponse with answer, citations, evaluation, and metadata.
         """
         ACTIVE_REQUESTS.inc()
-        QUERY_COUNT.labels(query_type=request.query_type.value).inc()
+        labeled(QUERY_COUNT, query_type=request.query_type.value).inc()
 
-        state = WorkflowState(
-            query=request.query,
-            query_type=request.query_type,
-            company_filter=request.company_filter,
-            filing_type_filter=request.filing_type_filter.value
-            if request.filing_type_filter
-            else None,
-            top_k=request.top_k,
-            include_evaluation=request.include_evaluation,
-            start_time=time.perf_counter(),
-        )
+        state = self._initial_state(request)
 
         try:
             # Execute the graph
             final_state = await self._graph.ainvoke(state)
 
-            elapsed_ms = (time.perf_counter() - state.start_time) * 1000
-            QUERY_LATENCY.observe(elapsed_ms / 1000)
+            elapsed_s = time.perf_counter() - state.start_time
+            QUERY_LATENCY.observe(elapsed_s)
 
             response = QueryResponse(
                 query=request.query,
@@ -183,7 +175,7 @@ class QueryOrchestrator:
                 query_type=request.query_type,
                 model_used=final_state.model_used,
                 token_usage=final_state.token_usage,
-                latency_ms=round(elapsed_ms, 2),
+                latency_ms=round(elapsed_s * 1000, 2),
             )
 
             return response
@@ -191,6 +183,80 @@ class QueryOrchestrator:
         finally:
             ACTIVE_REQUESTS.dec()
 
+    async def stream(self, request: QueryRequest) -> AsyncGenerator[str, None]:
+        """Stream the response to a query as it is generated.
+
+        Runs retrieval and prompt assembly, then yields LLM output without
+        evaluation. Text is released one complete line at a time so PII
+        redaction and content filtering still see whole lines; the
+        forward-looking disclaimer, if needed, is yielded once at the end.
+
+        Args:
+            request: The incoming query request.
+
+        Yields:
+            Guarded response text segments.
+        """
+        ACTIVE_REQUESTS.inc()
+        labeled(QUERY_COUNT, query_type=request.query_type.value).inc()
+
+        state = self._initial_state(request)
+        state.include_evaluation = False
+
+        try:
+            await self._retrieve_node(state)
+            messages = build_rag_prompt(
+                query=state.query,
+                context_chunks=state.chunk_texts,
+                query_type=state.query_type,
+            )
+
+            has_fls = False
+            pending = ""
+            async for delta in self._llm_client.generate_stream(messages):
+                pending += delta
+                complete, newline, pending = pending.rpartition("\n")
+                if newline:
+                    text, fls = self._apply_guardrails(
+                        state, complete + newline, append_disclaimer=False, cache=False
+                    )
+                    has_fls = has_fls or fls
+                    yield text
+
+            if pending:
+                text, fls = self._apply_guardrails(
+                    state, pending, append_disclaimer=False, cache=False
+                )
+                has_fls = has_fls or fls
+                yield text
+            if has_fls:
+                yield FLS_DISCLAIMER
+
+            QUERY_LATENCY.observe(time.perf_counter() - state.start_time)
+            logger.info(
+                "workflow_stream_complete",
+                latency_ms=round((time.perf_counter() - state.start_time) * 1000, 2),
+                pii_entities_found=state.pii_entities_found,
+                content_filter_passed=state.content_filter_passed,
+            )
+
+        finally:
+            ACTIVE_REQUESTS.dec()
+
+    @staticmethod
+    def _initial_state(request: QueryRequest) -> WorkflowState:
+        return WorkflowState(
+            query=request.query,
+            query_type=request.query_type,
+            company_filter=request.company_filter,
+            filing_type_filter=request.filing_type_filter.value
+            if request.filing_type_filter
+            else None,
+            top_k=request.top_k,
+            include_evaluation=request.include_evaluation,
+            start_time=time.perf_counter(),
+        )
+
     # === Workflow Nodes ===
 
     async def _retrieve_node(self, state: WorkflowState) -> WorkflowState:
@@ -231,7 +297,15 @@ class QueryOrchestrator:
         state.messages = messages
 
         # Generate
-        response_text, usage = await self._llm_client.generate(messages=messages)
+        # Regeneration must not be served the answer that was just rejected
+        response_text, usage = await self._llm_client.generate(
+            messages=messages,
+            cache_query=state.query,
+            cache_scope=build_rag_prompt(
+                query="", context_chunks=state.chunk_texts, query_type=state.query_type
+            ),
+            refresh_cache=state.generation_attempts > 1,
+        )
 
         state.response_text = response_text
         state.token_usage = usage
@@ -258,28 +332,47 @@ class QueryOrchestrator:
         """Apply PII redaction and content filtering."""
         logger.info("workflow_guardrails")
 
+        state.response_text, _ = self._apply_guardrails(state, state.response_text)
+        return state
+
+    def _apply_guardrails(
+        self,
+        state: WorkflowState,
+        text: str,
+        append_disclaimer: bool = True,
+        cache: bool = True,
+    ) -> tuple[str, bool]:
+        """PII-redact and content-filter text, recording results on the state.
+
+        Returns:
+            The guarded text and whether it contains forward-looking statements.
+        """
         # PII redaction
-        pii_result = self._pii_redactor.redact(state.response_text)
+        pii_result = self._pii_redactor.redact(text, cache=cache)
         if pii_result.was_redacted:
-            state.response_text = pii_result.redacted_text
-            state.pii_entities_found = pii_result.entity_count
+            text = pii_result.redacted_text
+            state.pii_entities_found += pii_result.entity_count
             PII_REDACTIONS.inc()
             for entity in pii_result.entities_found:
-                PII_DETECTIONS.labels(entity_type=entity.entity_type.value).inc()
+                labeled(PII_DETECTIONS, entity_type=entity.entity_type.value).inc()
 
         # Content filtering
-        filter_result = self._content_filter.filter(state.response_text)
-        state.content_filter_passed = filter_result.passed
-        state.response_text = filter_result.filtered_text
+        filter_result = self._content_filter.filter(
+            text, append_disclaimer=append_disclaimer, cache=cache
+        )
+        state.content_filter_passed = state.content_filter_passed and filter_result.passed
         state.warnings.extend(filter_result.warnings)
 
+        has_fls = False
         for violation in filter_result.violations:
-            CONTENT_FILTER_VIOLATIONS.labels(
+            has_fls = has_fls or violation.violation_type is ViolationType.FORWARD_LOOKING
+            labeled(
+                CONTENT_FILTER_VIOLATIONS,
                 violation_type=violation.violation_type.value,
                 severity=violation.severity,
             ).inc()
 
-        return state
+        return filter_result.filtered_text, has_fls
 
     async def _assemble_node(self, state: WorkflowState) -> WorkflowState:
         """Final assembly - no-op, state is already complete."""
@@ -313,6 +406,14 @@ class QueryOrchestrator:
             return "regenerate"
         return "continue"
 
+    @property
+    def llm_client(self) -> LLMClient:
+        return self._llm_client
+
+    @property
+    def evaluation(self) -> EvaluationPipeline:
+        return self._evaluation
+
     @property
     def embedding_service(self) -> EmbeddingService:
         return self._embedding_service
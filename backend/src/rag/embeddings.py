@@ -10,12 +10,12 @@ import hashlib
 from typing import Any
 
 import numpy as np
-from openai import AsyncOpenAI
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.core.config import get_settings
 from src.core.exceptions import EmbeddingError
 from src.core.logging import get_logger
+from src.llm.client import get_openai_client
 from src.monitoring.metrics import EMBEDDING_TOKENS, EMBEDDING_LATENCY
 
 logger = get_logger(__name__)
@@ -23,15 +23,28 @@ logger = get_logger(__name__)
 # Maximum batch size for OpenAI embedding API
 MAX_BATCH_SIZE = 2048
 
+# Input tokens packed into one request when counts are known; the API
+# rejects requests over 300k tokens
+MAX_BATCH_TOKENS = 250_000
+
+# Models that can return shortened vectors via the ``dimensions`` parameter
+SHORTENABLE_MODEL_PREFIX = "text-embedding-3"
+
+# Full vector width of each shortenable model
+NATIVE_DIMENSIONS = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+}
+
 
 class EmbeddingService:
     """Generates and caches text embeddings using OpenAI's API."""
 
     def __init__(self) -> None:
         settings = get_settings()
-        self._client = AsyncOpenAI(api_key=settings.openai_api_key.get_secret_value())
+        self._client = get_openai_client()
         self._model = settings.openai_embedding_model
-        self._dimensions = settings.embedding_dimensions
+        self._request_options = _request_options(self._model, settings.embedding_dimensions)
         self._cache: dict[str, list[float]] = {}
 
     @retry(
@@ -39,14 +52,20 @@ class EmbeddingService:
         wait=wait_exponential(multiplier=1, min=1, max=10),
         reraise=True,
     )
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    async def embed_texts(
+        self, texts: list[str], token_counts: list[int] | None = None
+    ) -> list[list[float]]:
         """Generate embeddings for a batch of texts.
 
         Args:
             texts: List of text strings to embed.
+            token_counts: Optional per-text token counts, e.g. the chunker's
+                ``DocumentChunk.token_count``. When given, requests are packed
+                up to ``MAX_BATCH_TOKENS`` instead of split by count alone.
 
         Returns:
-            List of embedding vectors, one per input text.
+            List of embedding vectors, one per input text. Repeated texts
+            are embedded once and share a vector.
 
         Raises:
             EmbeddingError: If the OpenAI API call fails after retries.
@@ -54,25 +73,33 @@ class EmbeddingService:
         if not texts:
             return []
 
-        # Check cache first
-        uncached_indices: list[int] = []
+        # Check cache first; uncached texts are grouped by key so duplicates
+        # within the call (e.g. overlapping retrieval results) are sent once
+        pending: dict[str, list[int]] = {}
         uncached_texts: list[str] = []
+        uncached_counts: list[int] = []
         results: dict[int, list[float]] = {}
 
         for i, text in enumerate(texts):
             cache_key = self._cache_key(text)
             if cache_key in self._cache:
                 results[i] = self._cache[cache_key]
+            elif cache_key in pending:
+                pending[cache_key].append(i)
             else:
-                uncached_indices.append(i)
+                pending[cache_key] = [i]
                 uncached_texts.append(text)
+                if token_counts is not None:
+                    uncached_counts.append(token_counts[i])
 
         if uncached_texts:
-            embeddings = await self._batch_embed(uncached_texts)
-            for idx, embedding in zip(uncached_indices, embeddings):
-                cache_key = self._cache_key(texts[idx])
+            embeddings = await self._batch_embed(
+                uncached_texts, uncached_counts if token_counts is not None else None
+            )
+            for (cache_key, indices), embedding in zip(pending.items(), embeddings):
                 self._cache[cache_key] = embedding
-                results[idx] = embedding
+                for idx in indices:
+                    results[idx] = embedding
 
         return [results[i] for i in range(len(texts))]
 
@@ -81,18 +108,21 @@ class EmbeddingService:
         embeddings = await self.embed_texts([query])
         return embeddings[0]
 
-    async def _batch_embed(self, texts: list[str]) -> list[list[float]]:
+    async def _batch_embed(
+        self, texts: list[str], token_counts: list[int] | None = None
+    ) -> list[list[float]]:
         """Embed texts in batches to respect API limits."""
         all_embeddings: list[list[float]] = []
 
-        for batch_start in range(0, len(texts), MAX_BATCH_SIZE):
-            batch = texts[batch_start : batch_start + MAX_BATCH_SIZE]
+        for batch_start, batch_end in _batch_bounds(len(texts), token_counts):
+            batch = texts[batch_start:batch_end]
 
             try:
                 with EMBEDDING_LATENCY.time():
                     response = await self._client.embeddings.create(
                         model=self._model,
                         input=batch,
+                        **self._request_options,
                     )
 
                 batch_embeddings = [
@@ -128,8 +158,65 @@ class EmbeddingService:
             return 0.0
         return float(dot / norm)
 
+    @staticmethod
+    def cosine_similarities(query: list[float], vectors: list[list[float]]) -> np.ndarray:
+        """Cosine similarity of ``query`` against every row of ``vectors`` at once.
+
+        One matrix-vector product over a float32 matrix replaces a Python
+        call per vector. Zero-norm rows score 0.0.
+        """
+        matrix = np.asarray(vectors, dtype=np.float32)
+        q = np.asarray(query, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(q)
+        return np.divide(
+            matrix @ q, norms, out=np.zeros(len(matrix), dtype=np.float32), where=norms > 0
+        )
+
     def _cache_key(self, text: str) -> str:
         return hashlib.sha256(text.encode()).hexdigest()[:16]
 
     def clear_cache(self) -> None:
         self._cache.clear()
+
+
+def _batch_bounds(n: int, token_counts: list[int] | None) -> list[tuple[int, int]]:
+    """Split ``n`` texts into ``(start, end)`` request slices, in input order.
+
+    Without token counts every slice holds ``MAX_BATCH_SIZE`` texts. With
+    them, each slice is filled greedily until the next text would push it
+    past ``MAX_BATCH_TOKENS``.
+    """
+    if token_counts is None:
+        return [(i, min(i + MAX_BATCH_SIZE, n)) for i in range(0, n, MAX_BATCH_SIZE)]
+
+    bounds: list[tuple[int, int]] = []
+    start = 0
+    batch_tokens = 0
+    for i, count in enumerate(token_counts):
+        if i > start and (
+            batch_tokens + count > MAX_BATCH_TOKENS or i - start >= MAX_BATCH_SIZE
+        ):
+            bounds.append((start, i))
+            start = i
+            batch_tokens = 0
+        batch_tokens += count
+    if start < n:
+        bounds.append((start, n))
+    return bounds
+
+
+def _request_options(model: str, dimensions: int | None) -> dict[str, Any]:
+    """Extra embedding request parameters for ``model``.
+
+    Shortened vectors shrink every stored embedding and the index distance
+    computations proportionally, at a small recall cost. They are only
+    requested when ``dimensions`` is configured and differs from the
+    model's native width, so existing collections keep their width.
+    """
+    if (
+        dimensions is None
+        or not model.startswith(SHORTENABLE_MODEL_PREFIX)
+        or dimensions == NATIVE_DIMENSIONS.get(model)
+    ):
+        return {}
+    return {"dimensions": dimensions}
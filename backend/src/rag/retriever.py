@@ -7,6 +7,7 @@ Injects source citations for every retrieved chunk.
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 from src.core.config import get_settings
@@ -206,7 +207,6 @@ class HybridRetriever:
                 found_terms.append(term)
 
         # Also extract potential ticker symbols (1-5 uppercase letters)
-        import re
         tickers = re.findall(r'\b[A-Z]{1,5}\b', query)
         found_terms.extend(tickers)
 
@@ -6,11 +6,13 @@ with metadata filtering for company-specific and filing-type queries.
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
 from typing import Any
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings as ChromaSettings
 
 from src.core.config import VectorStoreProvider, get_settings
@@ -28,6 +30,15 @@ class VectorStoreBase(ABC):
     async def add_chunks(self, chunks: list[DocumentChunk], embeddings: list[list[float]]) -> int:
         """Store document chunks with their embeddings."""
 
+    async def bulk_add_chunks(
+        self, chunks: list[DocumentChunk], embeddings: list[list[float]]
+    ) -> int:
+        """Store a large batch of chunks using the provider's bulk-load path.
+
+        Providers without one fall back to ``add_chunks``.
+        """
+        return await self.add_chunks(chunks, embeddings)
+
     @abstractmethod
     async def search(
         self,
@@ -69,36 +80,38 @@ class ChromaVectorStore(VectorStoreBase):
         if not chunks:
             return 0
 
-        ids = [chunk.chunk_id for chunk in chunks]
-        documents = [chunk.content for chunk in chunks]
-        metadatas = [
-            {
-                "document_id": chunk.document_id,
-                "company_name": chunk.metadata.company_name,
-                "ticker": chunk.metadata.ticker,
-                "filing_type": chunk.metadata.filing_type.value
-                if hasattr(chunk.metadata.filing_type, "value")
-                else str(chunk.metadata.filing_type),
-                "section": chunk.metadata.section,
-                "filing_date": chunk.metadata.filing_date,
-                "chunk_index": chunk.chunk_index,
-                "token_count": chunk.token_count,
-            }
-            for chunk in chunks
-        ]
-
         try:
-            self._collection.add(
-                ids=ids,
-                documents=documents,
-                embeddings=embeddings,
-                metadatas=metadatas,
-            )
+            self._collection.add(**self._to_records(chunks, embeddings))
             logger.info("chunks_stored", count=len(chunks))
             return len(chunks)
         except Exception as e:
             raise RetrievalError(f"Failed to store chunks in ChromaDB: {e}") from e
 
+    async def bulk_add_chunks(
+        self, chunks: list[DocumentChunk], embeddings: list[list[float]]
+    ) -> int:
+        """Load chunks in the largest batches Chroma accepts, off the event loop.
+
+        Each ``add`` call updates the HNSW index once for the whole batch,
+        and the worker thread keeps those updates from stalling other requests.
+        """
+        if not chunks:
+            return 0
+
+        batch_size = self._client.get_max_batch_size()
+
+        def load() -> None:
+            for start in range(0, len(chunks), batch_size):
+                end = start + batch_size
+                self._collection.add(**self._to_records(chunks[start:end], embeddings[start:end]))
+
+        try:
+            await asyncio.to_thread(load)
+            logger.info("chunks_bulk_stored", count=len(chunks), batch_size=batch_size)
+            return len(chunks)
+        except Exception as e:
+            raise RetrievalError(f"Failed to bulk-load chunks into ChromaDB: {e}") from e
+
     async def search(
         self,
         query_embedding: list[float],
@@ -188,6 +201,32 @@ class ChromaVectorStore(VectorStoreBase):
             "provider": "chromadb",
         }
 
+    @staticmethod
+    def _to_records(
+        chunks: list[DocumentChunk], embeddings: list[list[float]]
+    ) -> dict[str, Any]:
+        return {
+            "ids": [chunk.chunk_id for chunk in chunks],
+            "documents": [chunk.content for chunk in chunks],
+            # One contiguous float32 matrix instead of a Python float per value
+            "embeddings": np.asarray(embeddings, dtype=np.float32),
+            "metadatas": [
+                {
+                    "document_id": chunk.document_id,
+                    "company_name": chunk.metadata.company_name,
+                    "ticker": chunk.metadata.ticker,
+                    "filing_type": chunk.metadata.filing_type.value
+                    if hasattr(chunk.metadata.filing_type, "value")
+                    else str(chunk.metadata.filing_type),
+                    "section": chunk.metadata.section,
+                    "filing_date": chunk.metadata.filing_date,
+                    "chunk_index": chunk.chunk_index,
+                    "token_count": chunk.token_count,
+                }
+                for chunk in chunks
+            ],
+        }
+
     @staticmethod
     def _build_where_filter(metadata_filter: dict[str, Any] | None) -> dict[str, Any] | None:
         if not metadata_filter:
@@ -12,6 +12,14 @@ os.environ["CONTENT_FILTER_ENABLED"] = "true"
 os.environ["PROMETHEUS_ENABLED"] = "false"
 
 
+@pytest.fixture(scope="session")
+def scorer():
+    """Shared ConfidenceScorer; it is stateless, so one instance serves all tests."""
+    from src.evaluation.confidence_scorer import ConfidenceScorer
+
+    return ConfidenceScorer()
+
+
 @pytest.fixture(scope="session")
 def sample_sec_filing_text():
     """Sample SEC 10-K filing text for testing."""
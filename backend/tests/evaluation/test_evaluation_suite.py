@@ -11,7 +11,6 @@ These can be run with the 'evaluation' pytest marker:
 
 import pytest
 
-from src.evaluation.confidence_scorer import ConfidenceScorer
 from src.models.schemas import Citation
 
 
@@ -57,47 +56,28 @@ class TestEvaluationGoldenCases:
     the evaluation scoring works correctly on deterministic inputs.
     """
 
-    def test_confidence_scores_grounded_higher(self):
-        scorer = ConfidenceScorer()
-
-        grounded_result = scorer.score(
-            response_text=GROUNDED_CASE["response"],
-            query=GROUNDED_CASE["query"],
-            citations=[
-                Citation(
-                    chunk_id="1",
-                    source_document="Apple 10-K",
-                    section="MDA",
-                    relevance_score=0.95,
-                    text_excerpt="Revenue was $394.3B",
-                )
-            ],
-            source_chunks=GROUNDED_CASE["source_chunks"],
-            hallucination_score=0.1,
-            consistency_score=0.9,
+    def test_confidence_scores_grounded_higher(self, scorer):
+        citation = Citation(
+            chunk_id="1",
+            source_document="Apple 10-K",
+            section="MDA",
+            relevance_score=0.95,
+            text_excerpt="Revenue was $394.3B",
         )
-
-        hallucinated_result = scorer.score(
-            response_text=HALLUCINATED_CASE["response"],
-            query=HALLUCINATED_CASE["query"],
-            citations=[
-                Citation(
-                    chunk_id="1",
-                    source_document="Apple 10-K",
-                    section="MDA",
-                    relevance_score=0.95,
-                    text_excerpt="Revenue was $394.3B",
-                )
-            ],
-            source_chunks=HALLUCINATED_CASE["source_chunks"],
-            hallucination_score=0.8,
-            consistency_score=0.3,
+        cases = [GROUNDED_CASE, HALLUCINATED_CASE]
+
+        grounded_result, hallucinated_result = scorer.score_batch(
+            responses=[c["response"] for c in cases],
+            queries=[c["query"] for c in cases],
+            citations=[[citation], [citation]],
+            source_chunks=[c["source_chunks"] for c in cases],
+            hallucination_scores=[0.1, 0.8],
+            consistency_scores=[0.9, 0.3],
         )
 
         assert grounded_result.confidence_score > hallucinated_result.confidence_score
 
-    def test_citation_density_grounded_response(self):
-        scorer = ConfidenceScorer()
+    def test_citation_density_grounded_response(self, scorer):
         result = scorer.score(
             response_text=GROUNDED_CASE["response"],
             query=GROUNDED_CASE["query"],
@@ -106,8 +86,7 @@ class TestEvaluationGoldenCases:
         )
         assert result.citation_density_score > 0.0
 
-    def test_no_citations_in_hallucinated(self):
-        scorer = ConfidenceScorer()
+    def test_no_citations_in_hallucinated(self, scorer):
         result = scorer.score(
             response_text=HALLUCINATED_CASE["response"],
             query=HALLUCINATED_CASE["query"],
@@ -116,8 +95,7 @@ class TestEvaluationGoldenCases:
         )
         assert result.citation_density_score == 0.0
 
-    def test_specificity_with_numbers(self):
-        scorer = ConfidenceScorer()
+    def test_specificity_with_numbers(self, scorer):
         specific = "Revenue was $394.3 billion in FY2023, up 8% [Source 1]."
         vague = "Revenue was high and grew somewhat."
 
@@ -1,9 +1,17 @@
 """Integration tests for the FastAPI application endpoints."""
 
+import io
+from types import SimpleNamespace
+
 import pytest
+from fastapi import HTTPException, UploadFile
 from httpx import ASGITransport, AsyncClient
 
-from src.main import app
+import src.main
+from src.api import dependencies
+from src.api.routes import documents
+from src.main import app, fastapi_app, lifespan
+from src.models.schemas import IngestJobStatus, SECFilingResponse
 
 
 @pytest.fixture
@@ -14,6 +22,104 @@ async def client():
         yield ac
 
 
+def minimal_pdf(text):
+    """A one-page PDF whose text layer is ``text``."""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return bytes(pdf)
+
+
+@pytest.fixture
+def stored_chunks():
+    chunks = []
+
+    async def embed_texts(texts, token_counts=None):
+        return [[0.0] for _ in texts]
+
+    async def add_chunks(new_chunks, embeddings):
+        chunks.extend(new_chunks)
+        return len(new_chunks)
+
+    orchestrator = SimpleNamespace(
+        embedding_service=SimpleNamespace(embed_texts=embed_texts),
+        vector_store=SimpleNamespace(add_chunks=add_chunks),
+    )
+    fastapi_app.dependency_overrides[dependencies.get_orchestrator] = lambda: orchestrator
+    yield chunks
+    fastapi_app.dependency_overrides.pop(dependencies.get_orchestrator)
+
+
+@pytest.fixture
+def stream_output():
+    """Text segments the overridden orchestrator streams; exceptions are raised."""
+    segments = []
+
+    async def stream(request):
+        for segment in segments:
+            if isinstance(segment, Exception):
+                raise segment
+            yield segment
+
+    orchestrator = SimpleNamespace(stream=stream)
+    fastapi_app.dependency_overrides[dependencies.get_orchestrator] = lambda: orchestrator
+    yield segments
+    fastapi_app.dependency_overrides.pop(dependencies.get_orchestrator)
+
+
+STREAM_REQUEST = {"query": "What are Apple's main risk factors?"}
+
+
+SEC_JOB_REQUEST = {"ticker": "AAPL", "filing_type": "10-K"}
+
+
+class FakeJobStore:
+    def __init__(self):
+        self.jobs = {}
+        self.saved_statuses = []
+
+    async def save(self, job):
+        self.jobs[job.job_id] = job.model_copy(deep=True)
+        self.saved_statuses.append(job.status)
+
+    async def get(self, job_id):
+        return self.jobs.get(job_id)
+
+
+@pytest.fixture
+def job_store():
+    store = FakeJobStore()
+    overrides = {
+        dependencies.get_job_store: lambda: store,
+        dependencies.get_orchestrator: lambda: None,
+        dependencies.get_downloader: lambda: None,
+        dependencies.get_parser: lambda: None,
+        dependencies.get_chunker: lambda: None,
+    }
+    fastapi_app.dependency_overrides.update(overrides)
+    yield store
+    for dependency in overrides:
+        fastapi_app.dependency_overrides.pop(dependency)
+
+
 @pytest.mark.integration
 class TestHealthEndpoints:
     async def test_health_check(self, client):
@@ -34,6 +140,26 @@ class TestHealthEndpoints:
         assert response.status_code == 200
         assert response.json()["status"] == "alive"
 
+    async def test_probe_rejects_non_get(self, client):
+        response = await client.post("/ready")
+        assert response.status_code == 405
+        assert "GET" in response.headers["allow"]
+
+
+@pytest.mark.integration
+class TestLifespan:
+    async def test_failed_warm_up_does_not_block_startup(self, client, monkeypatch):
+        def offline():
+            raise ConnectionError("offline")
+
+        monkeypatch.setattr(src.main, "get_encoder", offline)
+        monkeypatch.setattr(src.main, "get_llm_client", offline)
+        monkeypatch.setattr(src.main, "get_llm_cache", offline)
+
+        async with lifespan(app):
+            response = await client.get("/health")
+        assert response.status_code == 200
+
 
 @pytest.mark.integration
 class TestQueryEndpoints:
@@ -58,6 +184,29 @@ class TestQueryEndpoints:
         # May fail with 500 if no OpenAI key, but should not be 422
         assert response.status_code in (200, 500)
 
+    async def test_stream_sse_frames(self, client, stream_output):
+        stream_output.extend(["Revenue rose.\n", "Margins held."])
+
+        response = await client.post("/api/v1/query/stream", json=STREAM_REQUEST)
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.content == (
+            b'data: {"text":"Revenue rose.\\n"}\n\n'
+            b'data: {"text":"Margins held."}\n\n'
+            b"data: [DONE]\n\n"
+        )
+
+    async def test_stream_error_frame_ends_stream(self, client, stream_output):
+        stream_output.extend(["Revenue rose.\n", RuntimeError("LLM streaming failed")])
+
+        response = await client.post("/api/v1/query/stream", json=STREAM_REQUEST)
+
+        assert response.status_code == 200
+        assert response.content == (
+            b'data: {"text":"Revenue rose.\\n"}\n\n'
+            b'data: {"error":"LLM streaming failed"}\n\n'
+        )
+
 
 @pytest.mark.integration
 class TestDocumentEndpoints:
@@ -72,11 +221,45 @@ class TestDocumentEndpoints:
         assert response.status_code == 400
 
     async def test_upload_wrong_filetype(self, client):
-        import io
         files = {"file": ("test.exe", io.BytesIO(b"content"), "application/octet-stream")}
         response = await client.post("/api/v1/documents/upload", files=files)
         assert response.status_code == 400
 
+    async def test_upload_misnamed_binary(self, client):
+        files = {"file": ("report.pdf", io.BytesIO(b"MZ\x90\x00binary"), "application/pdf")}
+        response = await client.post("/api/v1/documents/upload", files=files)
+        assert response.status_code == 415
+
+    async def test_upload_pdf_text_is_indexed(self, client, stored_chunks):
+        pdf = minimal_pdf("Total net sales were 383 billion dollars in fiscal 2023. " * 8)
+        files = {"file": ("report.pdf", io.BytesIO(pdf), "application/pdf")}
+        response = await client.post("/api/v1/documents/upload", files=files)
+
+        assert response.status_code == 200
+        assert response.json()["chunks_created"] == len(stored_chunks) > 0
+        assert "383 billion" in stored_chunks[0].content
+
+    async def test_upload_corrupt_pdf(self, client, stored_chunks):
+        files = {"file": ("report.pdf", io.BytesIO(b"%PDF-1.4 truncated"), "application/pdf")}
+        response = await client.post("/api/v1/documents/upload", files=files)
+        assert response.status_code == 422
+
+    async def test_upload_over_size_limit(self, client, stored_chunks, monkeypatch):
+        limits = SimpleNamespace(max_upload_size_mb=0)
+        monkeypatch.setattr(documents, "get_settings", lambda: limits)
+        files = {"file": ("report.pdf", io.BytesIO(minimal_pdf("Revenue")), "application/pdf")}
+        response = await client.post("/api/v1/documents/upload", files=files)
+        assert response.status_code == 413
+
+    async def test_pdf_without_declared_size_is_capped(self):
+        file = UploadFile(io.BytesIO(minimal_pdf("Revenue")), filename="report.pdf")
+        assert file.size is None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await documents._read_pdf_text(file, max_bytes=64)
+        assert exc_info.value.status_code == 413
+        assert await documents._read_pdf_text(file, max_bytes=1 << 20) == "Revenue"
+
 
 @pytest.mark.integration
 class TestEvaluationEndpoints:
@@ -86,3 +269,51 @@ class TestEvaluationEndpoints:
         data = response.json()
         assert "total_queries" in data
         assert "avg_hallucination_score" in data
+
+
+@pytest.mark.integration
+class TestIngestJobEndpoints:
+    async def test_job_runs_to_completion(self, client, job_store, monkeypatch):
+        async def fake_ingest(request, *services):
+            return SECFilingResponse(
+                ticker=request.ticker,
+                filing_type=request.filing_type,
+                documents_processed=1,
+                total_chunks=12,
+                processing_time_ms=5.0,
+            )
+
+        monkeypatch.setattr(documents, "_ingest_sec", fake_ingest)
+
+        response = await client.post("/api/v1/documents/ingest/sec/jobs", json=SEC_JOB_REQUEST)
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        response = await client.get(f"/api/v1/documents/ingest/sec/jobs/{job_id}")
+        assert response.status_code == 200
+        job = response.json()
+        assert job["status"] == "completed"
+        assert job["result"]["total_chunks"] == 12
+        assert job["started_at"] is not None
+        assert job_store.saved_statuses == [
+            IngestJobStatus.PENDING,
+            IngestJobStatus.RUNNING,
+            IngestJobStatus.COMPLETED,
+        ]
+
+    async def test_failed_job_records_error(self, client, job_store, monkeypatch):
+        async def fake_ingest(request, *services):
+            raise RuntimeError("EDGAR unavailable")
+
+        monkeypatch.setattr(documents, "_ingest_sec", fake_ingest)
+
+        response = await client.post("/api/v1/documents/ingest/sec/jobs", json=SEC_JOB_REQUEST)
+        job_id = response.json()["job_id"]
+
+        job = (await client.get(f"/api/v1/documents/ingest/sec/jobs/{job_id}")).json()
+        assert job["status"] == "failed"
+        assert job["error"] == "EDGAR unavailable"
+
+    async def test_unknown_job_is_404(self, client, job_store):
+        response = await client.get("/api/v1/documents/ingest/sec/jobs/does-not-exist")
+        assert response.status_code == 404
@@ -101,3 +101,17 @@ class TestFinancialDocumentChunker:
         chunks = chunker.chunk_filing(sample_filing)
         doc_ids = set(c.document_id for c in chunks)
         assert len(doc_ids) == 1  # all chunks share one document ID
+
+    def test_parallel_chunking_matches_sequential(self, chunker, sample_filing):
+        # Four sections crosses the process-pool threshold
+        sample_filing.sections = sample_filing.sections * 2
+        chunks = chunker.chunk_filing(sample_filing)
+
+        expected: list[str] = []
+        for section in sample_filing.sections:
+            expected.extend(
+                c.content for c in chunker._chunk_section(section, sample_filing, "doc")
+            )
+
+        assert [c.content for c in chunks] == expected
+        assert [c.chunk_index for c in chunks] == list(range(len(chunks)))
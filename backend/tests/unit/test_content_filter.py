@@ -68,3 +68,19 @@ class TestContentFilter:
         )
         result = content_filter.filter(text)
         assert result.passed
+
+    def test_repeated_text_served_from_cache(self, content_filter):
+        text = "We recommend you should buy this stock."
+        first = content_filter.filter(text)
+        first.violations.clear()
+
+        second = content_filter.filter(text)
+        assert not second.passed
+        assert second.violations
+        assert len(content_filter._results) == 1
+
+    def test_uncached_call_leaves_cache_empty(self, content_filter):
+        result = content_filter.filter("We recommend you should buy this stock.", cache=False)
+
+        assert not result.passed
+        assert not content_filter._results
@@ -0,0 +1,62 @@
+"""Unit tests for embedding batching and de-duplication."""
+
+import pytest
+
+from src.rag.embeddings import (
+    MAX_BATCH_SIZE,
+    MAX_BATCH_TOKENS,
+    EmbeddingService,
+    _batch_bounds,
+    _request_options,
+)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = EmbeddingService()
+    service.requests = []
+
+    async def fake_batch_embed(texts, token_counts=None):
+        service.requests.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+    monkeypatch.setattr(service, "_batch_embed", fake_batch_embed)
+    return service
+
+
+class TestEmbedTexts:
+    async def test_duplicate_texts_embedded_once(self, service):
+        embeddings = await service.embed_texts(["risk", "revenue", "risk"])
+
+        assert service.requests == [["risk", "revenue"]]
+        assert embeddings == [[4.0], [7.0], [4.0]]
+
+    async def test_cached_texts_not_resent(self, service):
+        await service.embed_texts(["risk"])
+        await service.embed_texts(["risk", "margin"])
+
+        assert service.requests == [["risk"], ["margin"]]
+
+
+class TestBatchBounds:
+    def test_count_only_batches(self):
+        assert _batch_bounds(MAX_BATCH_SIZE + 1, None) == [
+            (0, MAX_BATCH_SIZE),
+            (MAX_BATCH_SIZE, MAX_BATCH_SIZE + 1),
+        ]
+
+    def test_token_budget_splits_batches(self):
+        half = MAX_BATCH_TOKENS // 2
+        assert _batch_bounds(3, [half, half, 1]) == [(0, 2), (2, 3)]
+
+
+class TestRequestOptions:
+    def test_native_width_by_default(self):
+        assert _request_options("text-embedding-3-large", None) == {}
+        assert _request_options("text-embedding-3-large", 3072) == {}
+
+    def test_configured_shorter_width_requested(self):
+        assert _request_options("text-embedding-3-small", 512) == {"dimensions": 512}
+
+    def test_older_models_never_shortened(self):
+        assert _request_options("text-embedding-ada-002", 512) == {}
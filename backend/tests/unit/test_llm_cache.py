@@ -0,0 +1,94 @@
+"""Unit tests for the two-tier LLM response cache."""
+
+import numpy as np
+import pytest
+
+from src.llm.cache import SemanticCache
+from src.models.schemas import TokenUsage
+
+VOCAB = ["apple", "revenue", "fy2023", "risk", "microsoft", "what", "was", "were"]
+
+
+def bag_of_words(text: str) -> np.ndarray:
+    words = text.lower().replace("?", "").split()
+    vec = np.array([words.count(w) for w in VOCAB], dtype=float)
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+
+def rag_messages(question: str, context: str = "[Source 1] Apple revenue") -> list[dict[str, str]]:
+    return [
+        {"role": "system", "content": "You are an analyst."},
+        {"role": "user", "content": f"{context}\n\n## USER QUESTION\n{question}"},
+    ]
+
+
+@pytest.fixture
+def cache():
+    return SemanticCache(similarity_threshold=0.9, embedder=bag_of_words)
+
+
+def key_for(cache, question, **kwargs):
+    return cache.make_key(
+        "gpt-4o",
+        rag_messages(question, **kwargs),
+        {"temperature": 0.1},
+        question,
+        scope=rag_messages("", **kwargs),
+    )
+
+
+class TestSemanticCache:
+    async def test_exact_hit(self, cache):
+        await cache.put(key_for(cache, "What was Apple revenue?"), "answer")
+
+        hit = await cache.get(key_for(cache, "What was Apple revenue?"))
+        assert hit == ("answer", TokenUsage())
+
+    async def test_paraphrase_hits_within_same_context(self, cache):
+        await cache.put(key_for(cache, "What was Apple revenue?"), "answer")
+
+        assert await cache.get(key_for(cache, "Apple revenue was what")) is not None
+        assert await cache.get(key_for(cache, "What were Microsoft risk?")) is None
+
+    async def test_different_figures_miss(self, cache):
+        await cache.put(key_for(cache, "What was Apple revenue fy 2022?"), "answer")
+
+        assert await cache.get(key_for(cache, "What was Apple revenue fy 2023?")) is None
+        assert await cache.get(key_for(cache, "Apple revenue was what fy 2022")) is not None
+
+    async def test_different_context_misses(self, cache):
+        await cache.put(key_for(cache, "What was Apple revenue?"), "answer")
+
+        key = key_for(cache, "Apple revenue was what", context="[Source 1] Other filing")
+        assert await cache.get(key) is None
+
+    async def test_question_text_in_context_keeps_scope_apart(self, cache):
+        question = "Apple revenue"
+        await cache.put(key_for(cache, question, context="[Source 1] Apple revenue"), "answer")
+
+        key = key_for(cache, "Apple revenue was what", context="[Source 1] ")
+        assert await cache.get(key) is None
+
+    async def test_unscoped_keys_only_hit_exactly(self, cache):
+        def unscoped(question):
+            return cache.make_key("gpt-4o", rag_messages(question), {}, question)
+
+        await cache.put(unscoped("What was Apple revenue?"), "answer")
+
+        assert await cache.get(unscoped("Apple revenue was what")) is None
+        assert await cache.get(unscoped("What was Apple revenue?")) is not None
+
+    async def test_expired_entries_miss(self):
+        cache = SemanticCache(ttl_seconds=0, embedder=bag_of_words)
+        await cache.put(key_for(cache, "What was Apple revenue?"), "answer")
+
+        assert await cache.get(key_for(cache, "What was Apple revenue?")) is None
+
+    async def test_lru_eviction(self):
+        cache = SemanticCache(max_entries=1)
+        await cache.put(key_for(cache, "first question"), "a")
+        await cache.put(key_for(cache, "second question"), "b")
+
+        assert len(cache) == 1
+        assert await cache.get(key_for(cache, "first question")) is None
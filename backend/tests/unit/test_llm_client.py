@@ -0,0 +1,54 @@
+"""Unit tests for LLMClient request coalescing."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.llm.client import LLMClient
+
+MESSAGES = [{"role": "user", "content": "What was Apple revenue in FY2023?"}]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = LLMClient()
+    client._cache = None
+    client.calls = 0
+
+    async def fake_completion(**kwargs):
+        client.calls += 1
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=f"answer {client.calls}"))],
+            usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+        )
+
+    monkeypatch.setattr(client, "_create_completion", fake_completion)
+    return client
+
+
+class TestRequestCoalescing:
+    async def test_concurrent_duplicates_share_one_call(self, client):
+        results = await asyncio.gather(
+            *(client.generate(MESSAGES, cache_query="Apple revenue") for _ in range(5))
+        )
+
+        assert client.calls == 1
+        assert {content for content, _ in results} == {"answer 1"}
+        assert not client._inflight
+
+    async def test_uncacheable_requests_are_not_coalesced(self, client):
+        await asyncio.gather(*(client.generate(MESSAGES, temperature=0.3) for _ in range(3)))
+
+        assert client.calls == 3
+
+    async def test_cancelled_caller_does_not_cancel_shared_call(self, client):
+        first = asyncio.create_task(client.generate(MESSAGES, cache_query="Apple revenue"))
+        second = asyncio.create_task(client.generate(MESSAGES, cache_query="Apple revenue"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        content, _ = await second
+        assert content == "answer 1"
+        assert client.calls == 1
@@ -0,0 +1,48 @@
+"""Unit tests for the Hyperscan guardrail prefilter."""
+
+import re
+
+import pytest
+
+from src.guardrails.pattern_prefilter import PatternPrefilter, _to_ascii_pcre, fold_case
+
+SSN = re.compile(r"\b\d{3}-\d{2}-\d{4}\b")
+ROUTING = re.compile(r"\brouting\s*(?:number)?[:.\s]*\d{9}\b", re.IGNORECASE)
+
+
+@pytest.fixture
+def prefilter():
+    pytest.importorskip("hyperscan")
+    return PatternPrefilter([SSN, ROUTING])
+
+
+class TestPatternPrefilter:
+    def test_reports_only_matching_patterns(self, prefilter):
+        assert prefilter.candidates("SSN 123-45-6789 on file") == {SSN}
+        assert prefilter.candidates("Revenue grew 8% in FY2023") == frozenset()
+
+    def test_case_and_python_whitespace_follow_re(self, prefilter):
+        text = "ROUTING\x1c123456789"
+        assert ROUTING.search(text)
+        assert prefilter.candidates(text) == {ROUTING}
+
+    def test_pattern_hyperscan_rejects_is_undecided(self):
+        pytest.importorskip("hyperscan")
+        backreference = re.compile(r"(a)b\1")
+        assert PatternPrefilter([backreference]).candidates("aba") is None
+
+    def test_non_ascii_text_is_undecided(self, prefilter):
+        assert prefilter.candidates("Apple\u2019s SSN 123-45-6789") is None
+
+
+class TestAsciiTranslation:
+    def test_escapes_inside_and_outside_classes(self):
+        assert _to_ascii_pcre(r"[:.\s]*\d") == r"[:.\t\n\x0b\x0c\r\x1c-\x1f ]*[0-9]"
+
+
+class TestFoldCase:
+    def test_ignorecase_equivalents_fold_to_ascii(self):
+        text = "\u0130nvest, \u017fell, \u212aeep, rout\u0131ng"
+        for word in ("invest", "sell", "keep", "routing"):
+            assert re.search(word, text, re.IGNORECASE)
+            assert word in fold_case(text)
@@ -70,3 +70,32 @@ class TestPIIRedactor:
         text = "Revenue was $394,328 million with a 45.2% gross margin."
         result = redactor.redact(text)
         assert not result.was_redacted
+
+    def test_repeated_text_served_from_cache(self, redactor):
+        text = "SSN: 123-45-6789"
+        first = redactor.redact(text)
+        first.entities_found.clear()
+
+        second = redactor.redact(text)
+        assert second.redacted_text == first.redacted_text
+        assert second.entity_count == len(second.entities_found) >= 1
+        assert second.original_text == text
+        assert second.entities_found[0].text == "123-45-6789"
+        assert len(redactor._results) == 1
+
+    def test_cache_does_not_retain_raw_text(self, redactor):
+        redactor.redact("SSN: 123-45-6789")
+
+        (key, cached), = redactor._results.items()
+        assert b"123-45-6789" not in key
+        assert "123-45-6789" not in repr(cached)
+
+    def test_uncached_call_leaves_cache_empty(self, redactor):
+        result = redactor.redact("SSN: 123-45-6789", cache=False)
+
+        assert result.was_redacted
+        assert not redactor._results
+
+    def test_overlapping_entities_redacted_cleanly(self, redactor):
+        result = redactor.redact("Wire to account number 1234567890 today.")
+        assert result.redacted_text == "Wire to [ACCOUNT_REDACTED] today."
@@ -0,0 +1,45 @@
+"""Unit tests for bounded consumption of downloaded filings."""
+
+import asyncio
+
+from src.document_processing.sec_downloader import process_filings
+
+
+def _filings(count, state):
+    try:
+        for i in range(count):
+            state["read"] += 1
+            yield {"content": f"filing {i}"}
+    finally:
+        state["closed"] = True
+
+
+class TestProcessFilings:
+    async def test_reads_at_most_concurrency_filings_ahead(self):
+        state = {"read": 0, "done": 0, "closed": False, "max_resident": 0}
+
+        async def process(filing):
+            state["max_resident"] = max(state["max_resident"], state["read"] - state["done"])
+            await asyncio.sleep(0.01)
+            state["done"] += 1
+            return filing["content"]
+
+        results = await process_filings(_filings(10, state), process, concurrency=3)
+
+        assert sorted(results) == sorted(f"filing {i}" for i in range(10))
+        assert state["max_resident"] <= 3
+        assert state["closed"]
+
+    async def test_failed_filing_returned_with_results(self):
+        state = {"read": 0, "closed": False}
+
+        async def process(filing):
+            if filing["content"] == "filing 1":
+                raise ValueError("bad filing")
+            return filing["content"]
+
+        results = await process_filings(_filings(3, state), process, concurrency=2)
+
+        assert sum(isinstance(r, ValueError) for r in results) == 1
+        assert len(results) == 3
+        assert state["closed"]
@@ -106,7 +106,7 @@ class TestSECFilingParser:
 
     def test_clean_html_removes_scripts(self, parser):
         html_with_script = "<html><script>alert('test')</script><body>Content here</body></html>"
-        text = parser._clean_html(html_with_script)
+        text, _ = parser._parse_html(html_with_script)
         assert "alert" not in text
         assert "Content here" in text
 
@@ -120,7 +120,14 @@ class TestSECFilingParser:
         </table>
         </body></html>
         """
-        tables = parser._extract_tables(html_with_table)
+        _, tables = parser._parse_html(html_with_table)
         assert len(tables) == 1
         assert "Revenue" in tables[0]
         assert "$298.1B" in tables[0]
+
+    def test_quarterly_header_after_candidate_dense_line(self, parser):
+        dense = "Part I overview " * 20000
+        text = f"{dense}\nPart I, Item 2. Management's Discussion of results"
+        sections = parser._extract_sections(text, [])
+        assert [s.section for s in sections] == [SECSection.MDA_Q]
+        assert sections[0].start_position == len(dense) + 1
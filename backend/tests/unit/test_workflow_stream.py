@@ -0,0 +1,70 @@
+"""Unit tests for guardrails on the streaming query path."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.guardrails.content_filter import FLS_DISCLAIMER, ContentFilter
+from src.guardrails.pii_redactor import PIIRedactor
+from src.models.schemas import QueryRequest
+from src.orchestration.workflow import QueryOrchestrator
+
+REQUEST = QueryRequest(query="What did Apple say about revenue?", include_evaluation=False)
+
+
+def make_orchestrator(deltas):
+    # Only the components stream() touches; skips building the vector store
+    orchestrator = QueryOrchestrator.__new__(QueryOrchestrator)
+    orchestrator._pii_redactor = PIIRedactor()
+    orchestrator._content_filter = ContentFilter()
+
+    async def generate_stream(messages):
+        for delta in deltas:
+            yield delta
+
+    async def retrieve(state):
+        return state
+
+    orchestrator._llm_client = SimpleNamespace(generate_stream=generate_stream)
+    orchestrator._retrieve_node = retrieve
+    return orchestrator
+
+
+async def collect(deltas):
+    return [text async for text in make_orchestrator(deltas).stream(REQUEST)]
+
+
+class TestStreamGuardrails:
+    async def test_pii_split_across_deltas_is_redacted(self):
+        output = await collect(["Contact john.d", "oe@example.com for", " details.\n"])
+
+        assert "".join(output) == "Contact [EMAIL_REDACTED] for details.\n"
+
+    async def test_per_line_results_are_not_cached(self):
+        orchestrator = make_orchestrator(["SSN 123-45-6789.\n", "Revenue rose."])
+        _ = [text async for text in orchestrator.stream(REQUEST)]
+
+        assert not orchestrator._pii_redactor._results
+        assert not orchestrator._content_filter._results
+
+    async def test_trailing_partial_line_is_flushed(self):
+        output = await collect(["Revenue rose 8%.\nMargins", " held steady."])
+
+        assert output == ["Revenue rose 8%.\n", "Margins held steady."]
+
+    async def test_disclaimer_yielded_once_at_end(self):
+        output = await collect(
+            [
+                "Revenue is expected to rise.\n",
+                "Margins are projected to expand.\n",
+                "Future revenue depends on demand.",
+            ]
+        )
+
+        assert output.count(FLS_DISCLAIMER) == 1
+        assert output[-1] == FLS_DISCLAIMER
+        assert FLS_DISCLAIMER not in "".join(output[:-1])
+
+    @pytest.mark.parametrize("deltas", [["Revenue rose 8%.\n"], []])
+    async def test_no_disclaimer_without_forward_looking_text(self, deltas):
+        assert FLS_DISCLAIMER not in await collect(deltas)